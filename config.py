@@ -1,53 +1,102 @@
 """Configuration management for the trading bot."""
 
 import os
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+import warnings
+from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+EnvName = Union[str, Tuple[str, ...]]
+EnvSpec = Tuple[Tuple[str, EnvName, Callable[[str], Any], str], ...]
+
+VALID_CHAIN_IDS = (137, 80001)  # Polygon mainnet, Mumbai testnet
+MAX_PRECISION = 8  # Max decimal places for price/size rounding
+
+
+# ============================================================================
+# Environment Loading
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def _ensure_env_loaded() -> bool:
+    """Load the .env file into the environment on first use."""
+    load_dotenv()
+    return True
+
+
+def refresh_env(force: bool = True) -> None:
+    """Load the .env file and drop cached configs.
+    
+    Intended for setup tasks that create or edit .env while running.
+    
+    Args:
+        force: If True, re-read .env even if it was already loaded, with its
+            values overriding variables already set. If False, .env is parsed
+            at most once per process.
+    """
+    if force:
+        load_dotenv(override=True)
+    else:
+        _ensure_env_loaded()
+    reset_config_cache()
 
 
 # ============================================================================
 # Supabase Configuration
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SupabaseConfig:
     """Configuration for Supabase database."""
     url: str
     key: str
     table_name: str = "traders"  # Table name for traders
+    db_url: str = ""  # Optional direct Postgres DSN (session pooler) for COPY log inserts
+    read_url: str = ""  # Optional read replica API URL for trader reads
 
 
+@lru_cache(maxsize=1)
 def load_supabase_config() -> Optional[SupabaseConfig]:
     """Load Supabase configuration from environment variables.
     
     Returns:
         SupabaseConfig if URL and key are provided, None otherwise
     """
+    _ensure_env_loaded()
     url = os.getenv("SUPABASE_URL", "")
     key = os.getenv("SUPABASE_KEY", "")
     table_name = os.getenv("SUPABASE_TABLE_NAME", "traders")
+    db_url = os.getenv("SUPABASE_DB_URL", "")
+    read_url = os.getenv("SUPABASE_READ_URL", "")
     
     if url and key:
-        return SupabaseConfig(url=url, key=key, table_name=table_name)
+        return SupabaseConfig(url=url, key=key, table_name=table_name, db_url=db_url, read_url=read_url)
     return None
 
 
 def get_supabase_config() -> tuple[Optional[str], Optional[str]]:
     """Get Supabase configuration from environment (legacy function for backward compatibility).
     
+    Deprecated: use load_supabase_config() instead.
+    
     Returns:
         Tuple of (supabase_url, supabase_key)
     """
-    url = os.getenv("SUPABASE_URL", "")
-    key = os.getenv("SUPABASE_KEY", "")
-    return url, key
+    warnings.warn(
+        "get_supabase_config() is deprecated; use load_supabase_config()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    supabase_config = load_supabase_config()
+    if supabase_config is None:
+        return "", ""
+    return supabase_config.url, supabase_config.key
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ExecutionConfig:
     """Configuration for the execution layer.
     
@@ -66,11 +115,51 @@ class ExecutionConfig:
     request_timeout_seconds: int = 10  # From EXECUTION_TIMEOUT in .env
     price_precision: int = 4  # From EXECUTION_PRICE_PRECISION in .env
     size_precision: int = 2  # From EXECUTION_SIZE_PRECISION in .env
+    max_concurrent_requests: int = 32  # From EXECUTION_MAX_CONCURRENT_REQUESTS in .env
+    read_cache_ttl_seconds: float = 0.1  # From EXECUTION_READ_CACHE_TTL in .env (0 disables)
+    order_batch_window_seconds: float = 0.05  # From EXECUTION_ORDER_BATCH_WINDOW in .env (0 disables)
+    order_batch_max_size: int = 15  # From EXECUTION_ORDER_BATCH_SIZE in .env
+    orderbook_stream_enabled: bool = True  # From EXECUTION_ORDERBOOK_STREAM in .env
+    user_stream_enabled: bool = True  # From EXECUTION_USER_STREAM in .env
+    position_max_age_seconds: float = 10.0  # From EXECUTION_POSITION_MAX_AGE in .env (while the user stream is up)
+    signing_processes: int = 0  # From EXECUTION_SIGNING_PROCESSES in .env (0 signs on the thread pool)
+    
+    def __post_init__(self):
+        """Validate ranges once at load time so call sites can trust the values."""
+        if self.chain_id not in VALID_CHAIN_IDS:
+            raise ValueError(f"chain_id must be one of {VALID_CHAIN_IDS}, got {self.chain_id}")
+        if not 0 <= self.price_precision <= MAX_PRECISION:
+            raise ValueError(f"price_precision must be in 0..{MAX_PRECISION}, got {self.price_precision}")
+        if not 0 <= self.size_precision <= MAX_PRECISION:
+            raise ValueError(f"size_precision must be in 0..{MAX_PRECISION}, got {self.size_precision}")
+        if self.max_retries < 1:
+            raise ValueError(f"max_retries must be >= 1, got {self.max_retries}")
+        if self.retry_delay_seconds < 0:
+            raise ValueError(f"retry_delay_seconds must be >= 0, got {self.retry_delay_seconds}")
+        if self.request_timeout_seconds <= 0:
+            raise ValueError(f"request_timeout_seconds must be > 0, got {self.request_timeout_seconds}")
+        if self.max_concurrent_requests < 1:
+            raise ValueError(f"max_concurrent_requests must be >= 1, got {self.max_concurrent_requests}")
+        if self.read_cache_ttl_seconds < 0:
+            raise ValueError(f"read_cache_ttl_seconds must be >= 0, got {self.read_cache_ttl_seconds}")
+        if self.order_batch_window_seconds < 0:
+            raise ValueError(f"order_batch_window_seconds must be >= 0, got {self.order_batch_window_seconds}")
+        if self.order_batch_max_size < 1:
+            raise ValueError(f"order_batch_max_size must be >= 1, got {self.order_batch_max_size}")
+        if self.position_max_age_seconds < 0:
+            raise ValueError(f"position_max_age_seconds must be >= 0, got {self.position_max_age_seconds}")
+        if self.signing_processes < 0:
+            raise ValueError(f"signing_processes must be >= 0, got {self.signing_processes}")
+        self.api_base_url = sys.intern(self.api_base_url)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TraderConfig:
-    """Configuration for a single trader agent."""
+    """Configuration for a single trader agent.
+    
+    Frozen so cached instances can be shared safely; use dataclasses.replace()
+    to derive a modified copy.
+    """
     market_id: str  # Condition ID (for identification)
     token_id: str = ""  # Token ID for YES outcome (for API calls - required for orderbook/orders)
     market_slug: str = ""  # Market slug (e.g., "russia-x-ukraine-ceasefire-in-2025")
@@ -80,9 +169,81 @@ class TraderConfig:
     price_improvement: float = 1.0  # Price improvement in cents
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
+    
+    def __post_init__(self):
+        for name in _TRADER_INTERNED_FIELDS:
+            object.__setattr__(self, name, _intern_if_str(getattr(self, name)))  # Frozen dataclass
+        self._validate()
+    
+    def _validate(self) -> None:
+        """Validate ranges; also run by from_row(), which skips __post_init__."""
+        if not self.market_id:
+            raise ValueError("market_id is required")
+        if self.max_inventory < 0:
+            raise ValueError(f"max_inventory must be >= 0, got {self.max_inventory}")
+        if self.price_improvement < 0:
+            raise ValueError(f"price_improvement must be >= 0, got {self.price_improvement}")
+        if self.max_retries < 1:
+            raise ValueError(f"max_retries must be >= 1, got {self.max_retries}")
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "TraderConfig":
+        """Build a TraderConfig from a dict keyed by field name.
+        
+        Bypasses the generated __init__ and assigns slots directly through a
+        constructor generated at import time; used on the Supabase/cache load
+        paths. Missing keys take the field default,
+        unknown keys are ignored. Identifier strings are interned.
+        
+        Raises:
+            KeyError: If a required field (market_id) is missing
+            ValueError: If a value is out of range
+        """
+        return _trader_from_row(row)
+
+
+# (field_name, default) pairs, computed once for TraderConfig.from_row()
+_TRADER_FIELD_DEFAULTS = tuple((f.name, f.default) for f in fields(TraderConfig))
+
+# Identifier fields used as dict keys / compared often; interned on load
+_TRADER_INTERNED_FIELDS = frozenset({"market_id", "token_id", "market_slug", "name"})
+
 
+def _intern_if_str(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
 
-@dataclass
+
+def _build_row_factory(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    """Generate a from-row constructor with the field names inlined.
+    
+    The generated function does one dict access and one slot store per field,
+    with no per-row loop over dataclass fields.
+    """
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "set_slot": object.__setattr__,  # Works on frozen dataclasses
+        "intern": _intern_if_str,
+    }
+    lines = ["def from_row(row):", "    config = cls.__new__(cls)"]
+    for name, default in _TRADER_FIELD_DEFAULTS:
+        if default is MISSING:
+            expr = f"row[{name!r}]"
+        else:
+            namespace[f"default_{name}"] = default
+            expr = f"row.get({name!r}, default_{name})"
+        if name in _TRADER_INTERNED_FIELDS:
+            expr = f"intern({expr})"
+        lines.append(f"    set_slot(config, {name!r}, {expr})")
+    lines.append("    config._validate()")
+    lines.append("    return config")
+    exec("\n".join(lines), namespace)
+    return namespace["from_row"]
+
+
+_trader_from_row = _build_row_factory(TraderConfig)
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class ManagerConfig:
     """Configuration for the trader manager.
     
@@ -94,39 +255,99 @@ class ManagerConfig:
     status_update_interval_seconds: float = 5.0  # From MANAGER_STATUS_INTERVAL in .env
     supabase_sync_interval_seconds: float = 30.0  # From MANAGER_SUPABASE_SYNC_INTERVAL in .env
     enable_emergency_shutdown: bool = True  # From MANAGER_EMERGENCY_SHUTDOWN in .env
+    max_concurrent_steps: int = 16  # From MANAGER_MAX_CONCURRENT_STEPS in .env
+    idle_poll_interval_seconds: float = 5.0  # From MANAGER_IDLE_POLL_INTERVAL in .env (no running traders)
+    console_status: bool = False  # From MANAGER_CONSOLE_STATUS in .env (also print status when stdout isn't a TTY)
+    
+    def __post_init__(self):
+        """Validate ranges once at load time so the run loop can trust the values."""
+        if self.poll_interval_seconds <= 0:
+            raise ValueError(f"poll_interval_seconds must be > 0, got {self.poll_interval_seconds}")
+        if self.max_total_pnl_loss > 0:
+            raise ValueError(f"max_total_pnl_loss must be <= 0, got {self.max_total_pnl_loss}")
+        if self.status_update_interval_seconds < 0:
+            raise ValueError(f"status_update_interval_seconds must be >= 0, got {self.status_update_interval_seconds}")
+        if self.supabase_sync_interval_seconds <= 0:
+            raise ValueError(f"supabase_sync_interval_seconds must be > 0, got {self.supabase_sync_interval_seconds}")
+        if self.max_concurrent_steps < 1:
+            raise ValueError(f"max_concurrent_steps must be >= 1, got {self.max_concurrent_steps}")
+        if self.idle_poll_interval_seconds <= 0:
+            raise ValueError(f"idle_poll_interval_seconds must be > 0, got {self.idle_poll_interval_seconds}")
 
 
 # ============================================================================
 # Configuration Loaders
 # ============================================================================
 
+def _env_bool(value: str) -> bool:
+    """Parse a 'true'/'false' environment flag."""
+    return value.lower() == "true"
+
+
+def _getenv(env: EnvName, default: str) -> str:
+    """Read an env var; a tuple of names returns the first non-empty one."""
+    if isinstance(env, str):
+        return os.getenv(env, default)
+    for name in env:
+        value = os.getenv(name)
+        if value:
+            return value
+    return default
+
+
+def _load_from_spec(spec: EnvSpec) -> Dict[str, Any]:
+    """Build dataclass kwargs from a (field, env, caster, default) spec."""
+    return {name: caster(_getenv(env, default)) for name, env, caster, default in spec}
+
+
+# (field_name, env_var, caster, default)
+_EXEC_SPEC: EnvSpec = (
+    ("api_key", "POLYMARKET_API_KEY", str, ""),
+    ("api_secret", "POLYMARKET_API_SECRET", str, ""),
+    ("api_passphrase", ("POLYMARKET_PASSPHRASE", "POLYMARKET_API_PASSPHRASE"), str, ""),  # Support both names
+    ("private_key", "POLYMARKET_PRIVATE_KEY", str, ""),  # Wallet private key for signing orders
+    ("wallet_address", "POLYMARKET_ADDRESS", str, ""),  # Wallet address (optional)
+    ("chain_id", "POLYMARKET_CHAIN_ID", int, "137"),  # Polygon mainnet (137) or Mumbai testnet (80001)
+    ("api_base_url", "POLYMARKET_API_BASE_URL", str, "https://clob.polymarket.com"),
+    ("max_retries", "EXECUTION_MAX_RETRIES", int, "3"),
+    ("retry_delay_seconds", "EXECUTION_RETRY_DELAY", float, "0.5"),
+    ("request_timeout_seconds", "EXECUTION_TIMEOUT", int, "10"),
+    ("price_precision", "EXECUTION_PRICE_PRECISION", int, "4"),
+    ("size_precision", "EXECUTION_SIZE_PRECISION", int, "2"),
+    ("max_concurrent_requests", "EXECUTION_MAX_CONCURRENT_REQUESTS", int, "32"),  # CLOB client worker threads
+    ("read_cache_ttl_seconds", "EXECUTION_READ_CACHE_TTL", float, "0.1"),  # Orderbook/position/open-order reads
+    ("order_batch_window_seconds", "EXECUTION_ORDER_BATCH_WINDOW", float, "0.05"),  # Order post/cancel batching
+    ("order_batch_max_size", "EXECUTION_ORDER_BATCH_SIZE", int, "15"),
+    ("orderbook_stream_enabled", "EXECUTION_ORDERBOOK_STREAM", _env_bool, "true"),  # Market WebSocket books
+    ("user_stream_enabled", "EXECUTION_USER_STREAM", _env_bool, "true"),  # User WebSocket fill notifications
+    ("position_max_age_seconds", "EXECUTION_POSITION_MAX_AGE", float, "10.0"),
+    ("signing_processes", "EXECUTION_SIGNING_PROCESSES", int, "0"),  # Order signing worker processes
+)
+
+_MANAGER_SPEC: EnvSpec = (
+    ("poll_interval_seconds", "MANAGER_POLL_INTERVAL", float, "1.0"),
+    ("max_total_pnl_loss", "MANAGER_MAX_PNL_LOSS", float, "-1000.0"),
+    ("status_update_interval_seconds", "MANAGER_STATUS_INTERVAL", float, "5.0"),
+    ("supabase_sync_interval_seconds", "MANAGER_SUPABASE_SYNC_INTERVAL", float, "30.0"),
+    ("enable_emergency_shutdown", "MANAGER_EMERGENCY_SHUTDOWN", _env_bool, "true"),
+    ("max_concurrent_steps", "MANAGER_MAX_CONCURRENT_STEPS", int, "16"),
+    ("idle_poll_interval_seconds", "MANAGER_IDLE_POLL_INTERVAL", float, "5.0"),
+    ("console_status", "MANAGER_CONSOLE_STATUS", _env_bool, "false"),
+)
+
+
+@lru_cache(maxsize=1)
 def load_execution_config() -> ExecutionConfig:
     """Load execution config from environment variables."""
-    return ExecutionConfig(
-        api_key=os.getenv("POLYMARKET_API_KEY", ""),
-        api_secret=os.getenv("POLYMARKET_API_SECRET", ""),
-        api_passphrase=os.getenv("POLYMARKET_PASSPHRASE", "") or os.getenv("POLYMARKET_API_PASSPHRASE", ""),  # Support both names
-        private_key=os.getenv("POLYMARKET_PRIVATE_KEY", ""),  # Wallet private key for signing orders
-        wallet_address=os.getenv("POLYMARKET_ADDRESS", ""),  # Wallet address (optional)
-        chain_id=int(os.getenv("POLYMARKET_CHAIN_ID", "137")),  # Polygon mainnet (137) or Mumbai testnet (80001)
-        api_base_url=os.getenv("POLYMARKET_API_BASE_URL", "https://clob.polymarket.com"),
-        max_retries=int(os.getenv("EXECUTION_MAX_RETRIES", "3")),
-        retry_delay_seconds=float(os.getenv("EXECUTION_RETRY_DELAY", "0.5")),
-        request_timeout_seconds=int(os.getenv("EXECUTION_TIMEOUT", "10")),
-        price_precision=int(os.getenv("EXECUTION_PRICE_PRECISION", "4")),
-        size_precision=int(os.getenv("EXECUTION_SIZE_PRECISION", "2")),
-    )
+    _ensure_env_loaded()
+    return ExecutionConfig(**_load_from_spec(_EXEC_SPEC))
 
 
+@lru_cache(maxsize=1)
 def load_manager_config() -> ManagerConfig:
     """Load manager config from environment variables."""
-    return ManagerConfig(
-        poll_interval_seconds=float(os.getenv("MANAGER_POLL_INTERVAL", "1.0")),
-        max_total_pnl_loss=float(os.getenv("MANAGER_MAX_PNL_LOSS", "-1000.0")),
-        status_update_interval_seconds=float(os.getenv("MANAGER_STATUS_INTERVAL", "5.0")),
-        supabase_sync_interval_seconds=float(os.getenv("MANAGER_SUPABASE_SYNC_INTERVAL", "30.0")),
-        enable_emergency_shutdown=os.getenv("MANAGER_EMERGENCY_SHUTDOWN", "true").lower() == "true",
-    )
+    _ensure_env_loaded()
+    return ManagerConfig(**_load_from_spec(_MANAGER_SPEC))
 
 
 def load_default_trader_configs() -> List[TraderConfig]:
@@ -139,13 +360,20 @@ def load_default_trader_configs() -> List[TraderConfig]:
     
     Or configure them via Supabase.
     """
+    return list(_load_default_trader_configs())
+
+
+@lru_cache(maxsize=1)
+def _load_default_trader_configs() -> tuple[TraderConfig, ...]:
+    """Parse trader configs from environment (cached; see reset_config_cache())."""
+    _ensure_env_loaded()
     markets_str = os.getenv("TRADER_MARKETS", "")
     if not markets_str:
-        return []
+        return ()
     
-    markets = [m.strip() for m in markets_str.split(",") if m.strip()]
+    markets = [sys.intern(m.strip()) for m in markets_str.split(",") if m.strip()]
     if not markets:
-        return []
+        return ()
     
     # Parse other trader configs
     budgets_str = os.getenv("TRADER_BUDGETS", "")
@@ -155,18 +383,33 @@ def load_default_trader_configs() -> List[TraderConfig]:
     min_gaps = [float(g.strip()) for g in min_gaps_str.split(",")] if min_gaps_str else []
     
     names_str = os.getenv("TRADER_NAMES", "")
-    names = [n.strip() for n in names_str.split(",")] if names_str else []
+    names = [sys.intern(n.strip()) for n in names_str.split(",")] if names_str else []
     
-    configs = []
-    for idx, market in enumerate(markets):
-        configs.append(TraderConfig(
+    # Per-field defaults are read once, not per market
+    default_max_inventory = float(os.getenv("TRADER_DEFAULT_MAX_INVENTORY", "100.0"))
+    default_spread_threshold = float(os.getenv("TRADER_DEFAULT_SPREAD_THRESHOLD", "1.0"))
+    default_price_improvement = float(os.getenv("TRADER_DEFAULT_PRICE_IMPROVEMENT", "1.0"))
+    
+    configs = [
+        TraderConfig(
             market_id=market,  # Will be resolved from slug if needed
             market_slug=market,  # Assume it's a slug initially
-            name=names[idx] if idx < len(names) else "",
-            max_inventory=budgets[idx] if idx < len(budgets) else float(os.getenv("TRADER_DEFAULT_MAX_INVENTORY", "100.0")),
-            spread_threshold=min_gaps[idx] if idx < len(min_gaps) else float(os.getenv("TRADER_DEFAULT_SPREAD_THRESHOLD", "1.0")),
-            price_improvement=float(os.getenv("TRADER_DEFAULT_PRICE_IMPROVEMENT", "1.0")),
-        ))
+            name=name if name is not None else "",
+            max_inventory=budget if budget is not None else default_max_inventory,
+            spread_threshold=min_gap if min_gap is not None else default_spread_threshold,
+            price_improvement=default_price_improvement,
+        )
+        for market, name, budget, min_gap in zip_longest(markets, names, budgets, min_gaps)
+        if market is not None  # Ignore surplus values beyond the market list
+    ]
     
-    return configs
+    return tuple(configs)
+
+
+def reset_config_cache() -> None:
+    """Clear cached configs so the next load re-reads the environment."""
+    load_supabase_config.cache_clear()
+    load_execution_config.cache_clear()
+    load_manager_config.cache_clear()
+    _load_default_trader_configs.cache_clear()
 
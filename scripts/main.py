@@ -1,15 +1,28 @@
 """Entry point for the Polymarket market-maker/arbitrage bot."""
 
 import asyncio
+import json
 import logging
+import logging.handlers
+import mmap
+import queue
 import sys
 import os
-from typing import List
+import time
+from dataclasses import asdict
+from typing import Any, List
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # Optional - stdlib json is used for the trader cache if orjson is missing
+    orjson = None
+
 # Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from config import (
     TraderConfig,
@@ -19,36 +32,74 @@ from config import (
     load_execution_config,
     load_manager_config,
     load_supabase_config,
-    get_supabase_config,  # Legacy, for backward compatibility
 )
-from trading import TraderManager
-from services import SupabaseService, PolymarketService
 
 
 # Configure logging
-import os
-from pathlib import Path
-
 # Create logs directory if it doesn't exist
-log_dir = Path(__file__).parent.parent / "logs"
+log_dir = PROJECT_ROOT / "logs"
 log_dir.mkdir(exist_ok=True)
 
 # Create log file with timestamp
 from datetime import datetime
 log_filename = log_dir / f"trading_bot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 
-# Configure logging with both file and console handlers
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE_MAX_BYTES = 50 * 1024 * 1024  # Rotate log file at 50 MB
+LOG_FILE_BACKUP_COUNT = 5
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the asctime date/time part once per second.
+    
+    Only the millisecond suffix is formatted per record.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, "")  # (epoch second, formatted string)
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_str = self._time_cache
+        if second != cached_second:
+            cached_str = time.strftime(self.default_time_format, self.converter(second))
+            self._time_cache = (second, cached_str)
+        return self.default_msec_format % (cached_str, record.msecs)
+
+
+# Log calls only enqueue records; a QueueListener thread (started in main())
+# does the console/file writes so the event loop never blocks on disk I/O
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_formatter = CachedTimeFormatter(LOG_FORMAT)
+_console_handler = logging.StreamHandler(sys.stdout)  # Console output
+_file_handler = logging.handlers.RotatingFileHandler(  # File output
+    log_filename,
+    maxBytes=LOG_FILE_MAX_BYTES,
+    backupCount=LOG_FILE_BACKUP_COUNT,
+)
+for _handler in (_console_handler, _file_handler):
+    _handler.setFormatter(_log_formatter)
+
+# The queue handler only merges args (and tracebacks) into the message;
+# the listener's handlers apply LOG_FORMAT
+_queue_handler = logging.handlers.QueueHandler(log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),  # Console output
-        logging.FileHandler(log_filename),  # File output
-    ],
+    handlers=[_queue_handler],
+)
+log_listener = logging.handlers.QueueListener(
+    log_queue, _console_handler, _file_handler, respect_handler_level=True
 )
 
 logger = logging.getLogger(__name__)
 
+# Last trader list loaded from Supabase, served on startup while a fresh copy loads
+TRADER_CACHE_PATH = log_dir / ".trader_cache.json"
+TRADER_CACHE_MMAP_THRESHOLD = 1024 * 1024  # Parse caches >= 1 MB straight from an mmap
+
 
 def load_market_configs() -> List[TraderConfig]:
     """Load trader configurations for target markets.
@@ -63,12 +114,90 @@ def load_market_configs() -> List[TraderConfig]:
     return []
 
 
+def _read_trader_cache() -> Any:
+    """Parse the trader cache file, preferring orjson and mmap for large files."""
+    with open(TRADER_CACHE_PATH, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if orjson is None:
+            return json.loads(f.read())
+        if size < TRADER_CACHE_MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def load_cached_traders() -> List[TraderConfig]:
+    """Load the trader list persisted by the last successful Supabase load.
+    
+    Returns:
+        List of TraderConfig objects, or empty list if no usable cache exists
+    """
+    try:
+        rows = _read_trader_cache()
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable trader cache %s: %s", TRADER_CACHE_PATH, e)
+        return []
+    
+    configs = []
+    for row in rows:
+        try:
+            configs.append(TraderConfig.from_row(row))
+        except (KeyError, AttributeError, ValueError) as e:
+            logger.warning("Skipping malformed cached trader: %s", e)
+    return configs
+
+
+def save_cached_traders(trader_configs: List[TraderConfig]) -> None:
+    """Persist trader configs so the next startup can serve them immediately."""
+    tmp_path = TRADER_CACHE_PATH.with_suffix(".tmp")
+    try:
+        rows = [asdict(config) for config in trader_configs]
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(rows))
+        else:
+            tmp_path.write_text(json.dumps(rows))
+        tmp_path.replace(TRADER_CACHE_PATH)
+    except OSError as e:
+        logger.warning("Failed to write trader cache: %s", e)
+
+
+async def refresh_traders(supabase_service, manager) -> None:
+    """Reload traders from Supabase and apply them to the running manager.
+    
+    Runs in the background after startup has been served from the cache.
+    On failure (or an empty result) the cached trader list is kept.
+    """
+    try:
+        trader_configs = await supabase_service.load_all_traders()
+    except Exception as e:
+        logger.warning("Background trader refresh failed, keeping cached traders: %s", e)
+        return
+    
+    if not trader_configs:
+        logger.warning("Background trader refresh returned no traders, keeping cached traders")
+        return
+    
+    save_cached_traders(trader_configs)
+    if not manager.is_running:
+        # Don't add fresh traders to a manager that has already shut down
+        logger.info("Manager stopped before the background trader refresh finished")
+        return
+    manager.replace_traders(trader_configs)
+    logger.info("Refreshed %d traders from Supabase", len(trader_configs))
+
+
 async def main():
     """Main entry point."""
+    log_listener.start()
     logger.info("=" * 80)
     logger.info("Polymarket Market-Maker/Arbitrage Bot")
     logger.info("=" * 80)
     
+    execution_layer = None
+    supabase_service = None
+    refresh_task = None
     try:
         # Load configurations
         logger.info("Loading configurations...")
@@ -76,10 +205,16 @@ async def main():
         manager_config = load_manager_config()
         
         # Initialize Supabase service
-        supabase_url, supabase_key = get_supabase_config()
-        supabase_service = None
-        if supabase_url and supabase_key:
-            supabase_service = SupabaseService(supabase_url, supabase_key)
+        supabase_config = load_supabase_config()
+        if supabase_config:
+            from services import SupabaseService
+            supabase_service = SupabaseService(
+                supabase_config.url,
+                supabase_config.key,
+                db_url=supabase_config.db_url,
+                read_url=supabase_config.read_url,
+            )
+            await supabase_service.connect()
             if supabase_service.is_available():
                 logger.info("Supabase service initialized")
             else:
@@ -87,17 +222,26 @@ async def main():
         else:
             logger.warning("Supabase credentials not found. Traders will not persist to database.")
         
-        # Load traders from Supabase
+        # Load traders: serve the cached list immediately (stale-while-revalidate)
+        # and refresh from Supabase in the background; block only without a cache
         trader_configs = []
+        refresh_in_background = False
         if supabase_service and supabase_service.is_available():
-            trader_configs = await supabase_service.load_all_traders()
-            logger.info(f"Loaded {len(trader_configs)} traders from Supabase")
+            trader_configs = load_cached_traders()
+            if trader_configs:
+                refresh_in_background = True
+                logger.info("Loaded %d traders from cache (refreshing from Supabase)", len(trader_configs))
+            else:
+                trader_configs = await supabase_service.load_all_traders()
+                logger.info("Loaded %d traders from Supabase", len(trader_configs))
+                if trader_configs:
+                    save_cached_traders(trader_configs)
         
         # Fallback to local config if no traders in Supabase
         if not trader_configs:
             trader_configs = load_market_configs()
             if trader_configs:
-                logger.info(f"Loaded {len(trader_configs)} traders from local config (fallback)")
+                logger.info("Loaded %d traders from local config (fallback)", len(trader_configs))
         
         if not trader_configs:
             logger.warning("No trader configurations found. Configure traders via Supabase or .env file.")
@@ -111,6 +255,10 @@ async def main():
                 "Running in mock mode."
             )
         
+        # Trading stack is imported only once configs are loaded
+        from trading import TraderManager
+        from services import PolymarketService
+        
         # Initialize Polymarket service
         logger.info("Initializing Polymarket service...")
         execution_layer = PolymarketService(execution_config)
@@ -125,12 +273,10 @@ async def main():
         
         # Add traders
         logger.info("Adding traders...")
-        for trader_config in trader_configs:
-            manager.add_trader(trader_config)
-            logger.info(
-                f"  Added trader for market {trader_config.market_id} "
-                f"(max_inventory={trader_config.max_inventory}, spread_threshold={trader_config.spread_threshold}¢)"
-            )
+        manager.add_traders(trader_configs)
+        
+        if refresh_in_background:
+            refresh_task = asyncio.create_task(refresh_traders(supabase_service, manager))
         
         # Start the manager
         logger.info("Starting trader manager...")
@@ -140,12 +286,48 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
     finally:
+        if refresh_task is not None:
+            # Must not outlive the services it uses
+            refresh_task.cancel()
+            try:
+                await refresh_task
+            except asyncio.CancelledError:
+                pass
+        if execution_layer is not None:
+            await execution_layer.close()
+        if supabase_service is not None:
+            await supabase_service.close()
         logger.info("Bot shutdown complete")
+        log_listener.stop()  # Flushes queued records
+
+
+def run(coro) -> None:
+    """Run a coroutine on the fastest available event loop.
+    
+    Prefers uringcore (io_uring, Linux 5.11+), then uvloop, then the default
+    asyncio loop.
+    """
+    loop_factory = None
+    if sys.platform == "linux":
+        try:
+            import uringcore
+            loop_factory = uringcore.EventLoopPolicy().new_event_loop
+        except ImportError:
+            pass
+    if loop_factory is None and sys.platform != "win32":
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            pass
+    
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(coro)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
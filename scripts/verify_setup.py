@@ -3,11 +3,29 @@
 import sys
 import os
 import asyncio
+import importlib.util
 from pathlib import Path
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+REQUIRED_ENV_VARS = {
+    "POLYMARKET_API_KEY": "Polymarket API key",
+    "POLYMARKET_API_SECRET": "Polymarket API secret",
+}
+
+OPTIONAL_ENV_VARS = {
+    "SUPABASE_URL": "Supabase URL (optional but recommended)",
+    "SUPABASE_KEY": "Supabase key (optional but recommended)",
+}
+
+def load_env_snapshot():
+    """Load .env once and snapshot the variables the checks need."""
+    from config import refresh_env
+    refresh_env(force=False)
+    return {var: os.getenv(var, "") for var in (*REQUIRED_ENV_VARS, *OPTIONAL_ENV_VARS)}
 
 def check_dependencies():
     """Check if required dependencies are installed."""
@@ -21,19 +39,32 @@ def check_dependencies():
     
     missing = []
     for import_name, package_name in required:
-        try:
-            __import__(import_name)
+        # find_spec only locates the package; it does not execute its import
+        if importlib.util.find_spec(import_name) is not None:
             print(f"  ✅ {package_name}")
-        except ImportError:
+        else:
             print(f"  ❌ {package_name} - MISSING")
             missing.append(package_name)
     
+    optional = [
+        ("uvloop", "uvloop (faster event loop)"),
+        ("orjson", "orjson (faster JSON)"),
+        ("coincurve", "coincurve (C secp256k1 backend for order signing)"),
+        ("asyncpg", "asyncpg (COPY-based Supabase log inserts)"),
+    ]
+    
+    for import_name, package_name in optional:
+        if importlib.util.find_spec(import_name) is not None:
+            print(f"  ✅ {package_name}")
+        else:
+            print(f"  ⚠️  {package_name} - Not installed (optional)")
+    
     return len(missing) == 0
 
 def check_env_file():
     """Check if .env file exists."""
     print("\n🔍 Checking .env file...")
-    env_path = project_root / ".env"
+    env_path = PROJECT_ROOT / ".env"
     if env_path.exists():
         print("  ✅ .env file exists")
         return True
@@ -42,35 +73,22 @@ def check_env_file():
         print("     Copy .env.example to .env and fill in your values")
         return False
 
-def check_env_vars():
+def check_env_vars(env):
     """Check if required environment variables are set."""
     print("\n🔍 Checking environment variables...")
     
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    required = {
-        "POLYMARKET_API_KEY": "Polymarket API key",
-        "POLYMARKET_API_SECRET": "Polymarket API secret",
-    }
-    
-    optional = {
-        "SUPABASE_URL": "Supabase URL (optional but recommended)",
-        "SUPABASE_KEY": "Supabase key (optional but recommended)",
-    }
-    
     all_good = True
     
-    for var, desc in required.items():
-        value = os.getenv(var)
+    for var, desc in REQUIRED_ENV_VARS.items():
+        value = env.get(var)
         if value:
             print(f"  ✅ {var} - Set")
         else:
             print(f"  ❌ {var} - MISSING ({desc})")
             all_good = False
     
-    for var, desc in optional.items():
-        value = os.getenv(var)
+    for var, desc in OPTIONAL_ENV_VARS.items():
+        value = env.get(var)
         if value:
             print(f"  ✅ {var} - Set")
         else:
@@ -78,15 +96,12 @@ def check_env_vars():
     
     return all_good
 
-def check_supabase():
+def check_supabase(env):
     """Check Supabase connection if configured."""
     print("\n🔍 Checking Supabase connection...")
     
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
+    url = env.get("SUPABASE_URL")
+    key = env.get("SUPABASE_KEY")
     
     if not url or not key:
         print("  ⚠️  Supabase not configured (optional)")
@@ -94,16 +109,22 @@ def check_supabase():
     
     try:
         from services import SupabaseService
-        service = SupabaseService(url, key)
-        if service.is_available():
-            print("  ✅ Supabase connection successful")
-            # Run async function in sync context
-            traders = asyncio.run(service.load_all_traders())
-            print(f"  ✅ Found {len(traders)} traders in database")
-            return True
-        else:
+        
+        async def _check():
+            service = SupabaseService(url, key)
+            await service.connect()
+            if not service.is_available():
+                return None
+            return await service.load_all_traders()
+        
+        # Run async checks in sync context
+        traders = asyncio.run(_check())
+        if traders is None:
             print("  ❌ Supabase connection failed")
             return False
+        print("  ✅ Supabase connection successful")
+        print(f"  ✅ Found {len(traders)} traders in database")
+        return True
     except Exception as e:
         print(f"  ❌ Supabase check failed: {e}")
         return False
@@ -146,9 +167,11 @@ def main():
     
     results.append(("Dependencies", check_dependencies()))
     results.append(("Environment File", check_env_file()))
-    results.append(("Environment Variables", check_env_vars()))
+    
+    env = load_env_snapshot()
+    results.append(("Environment Variables", check_env_vars(env)))
     results.append(("Configuration", check_config()))
-    results.append(("Supabase", check_supabase()))
+    results.append(("Supabase", check_supabase(env)))
     
     print("\n" + "=" * 60)
     print("📊 Summary")
@@ -1,7 +1,29 @@
-"""Services layer for external integrations."""
+"""Services layer for external integrations.
 
-from .supabase_service import SupabaseService
-from .polymarket_service import PolymarketService, PolymarketServiceError
+Service classes are imported on first attribute access (PEP 562) so that
+importing this package does not pull in supabase/py_clob_client until used.
+"""
 
-__all__ = ["SupabaseService", "PolymarketService", "PolymarketServiceError"]
+import importlib
 
+_LAZY_ATTRS = {
+    "SupabaseService": ".supabase_service",
+    "PolymarketService": ".polymarket_service",
+    "PolymarketServiceError": ".polymarket_service",
+    "OrderBook": ".polymarket_service",
+}
+
+__all__ = ["SupabaseService", "PolymarketService", "PolymarketServiceError", "OrderBook"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,23 +1,137 @@
 """Polymarket service wrapping py_clob_client for Polymarket operations."""
 
 import asyncio
+import json
 import logging
+import random
+import sys
 import time
-from typing import Dict, List, Optional, Tuple
-from decimal import Decimal, ROUND_DOWN
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
 import aiohttp
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Optional - stdlib json is used for API payloads if orjson is missing
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_get_price = attrgetter("price")
+_get_size = attrgetter("size")
+
+# Field names seen across py_clob_client/API versions, most common first
+ORDER_ID_FIELDS = ("orderID", "orderId", "order_id", "id", "hash", "orderHash", "order_hash")
+TOKEN_ID_FIELDS = ("asset_id", "token_id", "tokenId", "token")
+SIZE_FIELDS = ("size", "original_size")
+
+# (type, field names) -> field that matched last time
+_field_cache: Dict[Tuple[type, Tuple[str, ...]], str] = {}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Return False for errors a retry cannot fix (client-side 4xx responses).
+    
+    Errors without an HTTP status (timeouts, connection resets, client
+    library errors) are treated as transient.
+    """
+    if isinstance(error, PolymarketServiceError):
+        return False
+    # aiohttp uses .status, py_clob_client's PolyApiException .status_code
+    status = getattr(error, "status", None) or getattr(error, "status_code", None)
+    if isinstance(status, int) and 400 <= status < 500:
+        return status in RETRYABLE_STATUS_CODES
+    return True
+
+
+# Per-process ClobClient used by signing workers (see _init_signer)
+_signer_client = None
+
+
+def _init_signer(client_kwargs: Dict[str, Any]) -> None:
+    """Build the signing client once in each worker process."""
+    global _signer_client
+    _signer_client = ClobClient(**client_kwargs)
+
+
+def _sign_order(order_args: Any) -> Any:
+    """Create and sign an order in a worker process."""
+    return _signer_client.create_order(order_args)
+
+
+def _strip_quotes(value: str) -> str:
+    """Strip whitespace and surrounding quotes left over from .env values."""
+    return value.strip().strip('"').strip("'").strip()
+
+
+def _extract_field(obj: Any, names: Tuple[str, ...]) -> Any:
+    """Return the first truthy field in names from a dict or an object.
+    
+    The field that matched last time for this type is tried first, so the
+    usual response shape costs a single lookup.
+    """
+    is_dict = isinstance(obj, dict)
+    key = (type(obj), names)
+    cached = _field_cache.get(key)
+    if cached is not None:
+        value = obj.get(cached) if is_dict else getattr(obj, cached, None)
+        if value:
+            return value
+    for name in names:
+        value = obj.get(name) if is_dict else getattr(obj, name, None)
+        if value:
+            _field_cache[key] = name
+            return value
+    return None
+
+
+def _order_rejection(resp: Any) -> Optional[str]:
+    """Return the reason a post_order response was rejected, or None if it was accepted.
+    
+    The CLOB reports per-order failures in the body (success false and/or
+    errorMsg) while the request itself succeeds.
+    """
+    if isinstance(resp, dict):
+        success = resp.get("success")
+        error = resp.get("errorMsg")
+    else:
+        success = getattr(resp, "success", None)
+        error = getattr(resp, "errorMsg", None)
+    if success is False or error:
+        return str(error or "order rejected")
+    return None
+
+
+def _split_cancel_response(resp: Any, order_ids: List[str]) -> List[Any]:
+    """Split a cancel response into one result per order id.
+    
+    Ids listed in the response's not_canceled map get a PolymarketServiceError;
+    the others get a response covering just that id.
+    """
+    if not isinstance(resp, dict):
+        return [resp] * len(order_ids)
+    not_canceled = resp.get("not_canceled") or {}
+    return [
+        PolymarketServiceError(f"Order {order_id} not cancelled: {not_canceled[order_id]}")
+        if order_id in not_canceled
+        else {"canceled": [order_id], "not_canceled": {}}
+        for order_id in order_ids
+    ]
+
 try:
     from py_clob_client.client import ClobClient
-    from py_clob_client.clob_types import OrderArgs, OrderType, TradeParams
+    from py_clob_client.clob_types import OpenOrderParams, OrderArgs, OrderType, TradeParams
     from py_clob_client.order_builder.constants import BUY, SELL
     CLOB_AVAILABLE = True
 except ImportError as e:
     # Fallback if py_clob_client is not available
     logger.warning(f"py_clob_client import failed: {e}")
     ClobClient = None
+    OpenOrderParams = None
     OrderArgs = None
     OrderType = None
     TradeParams = None
@@ -25,14 +139,166 @@ except ImportError as e:
     SELL = None
     CLOB_AVAILABLE = False
 
+try:
+    from py_clob_client.clob_types import PostOrdersArgs
+except ImportError:
+    # Older py_clob_client releases have no batch order endpoint
+    PostOrdersArgs = None
+
 from config import ExecutionConfig
 
+PRICE_TICK = Decimal("0.01")  # Polymarket typically uses 0.01 tick size (1 cent)
+
+RETRY_MAX_DELAY_SECONDS = 10.0  # Cap for the jittered backoff
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429})  # 4xx statuses that are worth retrying
+
+LATENCY_TRACKER_MAX_AGE_SECONDS = 60.0  # Untracked after this; bounds the dict for orders never seen filled
+
+MARKET_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+USER_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+WS_HEARTBEAT_SECONDS = 10.0
+WS_RECONNECT_DELAY_SECONDS = 2.0
+
 
 class PolymarketServiceError(Exception):
     """Exception raised by Polymarket service."""
     pass
 
 
+class OrderBook:
+    """Orderbook snapshot stored per side as parallel price/size tuples.
+    
+    Levels follow the CLOB REST ordering: bids ascending and asks descending,
+    so the best bid/ask is the LAST element of each side.
+    """
+    
+    __slots__ = ("bid_px", "bid_sz", "ask_px", "ask_sz", "min_order_size")
+    
+    def __init__(
+        self,
+        bid_px: Tuple[float, ...],
+        bid_sz: Tuple[float, ...],
+        ask_px: Tuple[float, ...],
+        ask_sz: Tuple[float, ...],
+        min_order_size: Optional[float] = None,
+    ):
+        self.bid_px = bid_px
+        self.bid_sz = bid_sz
+        self.ask_px = ask_px
+        self.ask_sz = ask_sz
+        self.min_order_size = min_order_size
+    
+    @classmethod
+    def from_levels(
+        cls,
+        bids: Dict[float, float],
+        asks: Dict[float, float],
+        min_order_size: Optional[float] = None,
+    ) -> "OrderBook":
+        """Build a snapshot from {price: size} maps of each side."""
+        bid_levels = sorted(bids.items())
+        ask_levels = sorted(asks.items(), reverse=True)
+        return cls(
+            tuple(price for price, _ in bid_levels),
+            tuple(size for _, size in bid_levels),
+            tuple(price for price, _ in ask_levels),
+            tuple(size for _, size in ask_levels),
+            min_order_size,
+        )
+    
+    def is_ordered(self) -> bool:
+        """Check the best-last ordering at the ends of each side (O(1))."""
+        bid_px, ask_px = self.bid_px, self.ask_px
+        return (len(bid_px) < 2 or bid_px[0] <= bid_px[-1]) and (len(ask_px) < 2 or ask_px[0] >= ask_px[-1])
+    
+    def best_bid(self) -> Optional[float]:
+        return self.bid_px[-1] if self.bid_px else None
+    
+    def best_ask(self) -> Optional[float]:
+        return self.ask_px[-1] if self.ask_px else None
+    
+    def to_dict(self) -> Dict:
+        """Return the legacy REST-style dict with string price/size levels."""
+        return {
+            "bids": [{"price": str(price), "size": str(size)} for price, size in zip(self.bid_px, self.bid_sz)],
+            "asks": [{"price": str(price), "size": str(size)} for price, size in zip(self.ask_px, self.ask_sz)],
+            "min_order_size": self.min_order_size,
+        }
+
+
+class _RequestBatcher:
+    """Coalesces single requests into batch calls.
+    
+    Items submitted within one window (or until max_size is reached) are
+    passed together to flush(), which must return one result per item in
+    the same order; an exception in place of a result fails only that item.
+    A failed flush fails every item in the batch.
+    """
+    
+    def __init__(
+        self,
+        flush: Callable[[List[Any]], Awaitable[List[Any]]],
+        window_seconds: float,
+        max_size: int,
+    ):
+        self._flush = flush
+        self._window_seconds = window_seconds
+        self._max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def submit(self, item: Any) -> Any:
+        """Queue an item for the next batch and wait for its result."""
+        if self._task is None or self._task.done():
+            # Started lazily so the queue and task belong to the running loop
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+    
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self._window_seconds)
+            while len(batch) < self._max_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            items = [item for item, _ in batch]
+            try:
+                results = await self._flush(items)
+                if len(results) != len(items):
+                    raise PolymarketServiceError(
+                        f"Batch returned {len(results)} results for {len(items)} requests"
+                    )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+    
+    async def close(self) -> None:
+        """Stop the batch loop and fail anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(PolymarketServiceError("Service closed"))
+
+
 class PolymarketService:
     """Service for interacting with Polymarket API via py_clob_client."""
     
@@ -40,8 +306,57 @@ class PolymarketService:
         """Initialize Polymarket service with config."""
         self.config = config
         self.client: Optional[ClobClient] = None
+        # Proxy wallet (funder) address, normalized once; None if not configured
+        self._wallet_address: Optional[str] = _strip_quotes(config.wallet_address) or None
+        self._client_address: Optional[str] = None  # Signer address, read once from the client
+        self._sign_pool: Optional[ProcessPoolExecutor] = None  # Optional process pool for order signing
+        # py_clob_client is blocking; its calls run on a dedicated pool sized to
+        # the configured concurrency instead of the loop's shared default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.max_concurrent_requests,
+            thread_name_prefix="clob",
+        )
         self._initialize_client()
-        self._latency_tracker: Dict[str, float] = {}  # order_id -> submission_time
+        self._latency_tracker: Dict[str, float] = {}  # order_id -> submission time (time.monotonic()), in submission order
+        self._fetch_semaphore = asyncio.Semaphore(config.max_concurrent_requests)  # Bounds multi-token fetches
+        self._http: Optional[aiohttp.ClientSession] = None  # Created lazily on the running loop
+        # Short-lived read caches: token_id (wallet address for positions) ->
+        # (fetch start time, in-flight or finished task)
+        self._orderbook_cache: Dict[str, Tuple[float, asyncio.Task]] = {}
+        self._position_cache: Dict[str, Tuple[float, asyncio.Task]] = {}
+        self._open_orders_cache: Dict[str, Tuple[float, asyncio.Task]] = {}
+        # Orderbooks kept live from the market WebSocket after a REST snapshot:
+        # token_id -> {"bids"/"asks": {price: size}}
+        self._books: Dict[str, Dict[str, Dict[float, float]]] = {}
+        # Sorted OrderBook per live book, rebuilt only after the book changes
+        self._book_snapshots: Dict[str, OrderBook] = {}
+        self._book_min_order_size: Dict[str, Optional[float]] = {}
+        self._stream_tokens: Set[str] = set()
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._ws_task: Optional[asyncio.Task] = None
+        # User channel: our fills/order updates invalidate the position and
+        # open-order caches, so positions need no polling while it is up
+        self._user_ws_task: Optional[asyncio.Task] = None
+        self._user_stream_live = False
+        # Last fill or (re)connect seen on the user channel (time.monotonic());
+        # the Data API lags fills, so positions are polled normally until it settles
+        self._last_position_event: Optional[float] = None
+        # Order posts/cancels are coalesced into the CLOB batch endpoints when available
+        self._order_batcher: Optional[_RequestBatcher] = None
+        self._cancel_batcher: Optional[_RequestBatcher] = None
+        if (
+            self.client is not None
+            and config.order_batch_window_seconds > 0
+            and PostOrdersArgs is not None
+            and hasattr(self.client, "post_orders")
+            and hasattr(self.client, "cancel_orders")
+        ):
+            self._order_batcher = _RequestBatcher(
+                self._post_order_batch, config.order_batch_window_seconds, config.order_batch_max_size
+            )
+            self._cancel_batcher = _RequestBatcher(
+                self._cancel_order_batch, config.order_batch_window_seconds, config.order_batch_max_size
+            )
         
     def _initialize_client(self):
         """Initialize the CLOB client."""
@@ -61,7 +376,7 @@ class PolymarketService:
             # Strip quotes from private key if present
             private_key = None
             if self.config.private_key:
-                private_key = self.config.private_key.strip('"').strip("'")
+                private_key = _strip_quotes(self.config.private_key)
             
             if not private_key:
                 logger.warning("⚠️ No private key configured - order submission will fail")
@@ -78,13 +393,21 @@ class PolymarketService:
             }
             
             # Add funder (proxy_address) if available (for Email/Magic accounts)
-            if hasattr(self.config, 'wallet_address') and self.config.wallet_address:
-                wallet_address = self.config.wallet_address.strip('"').strip("'")
-                client_kwargs["funder"] = wallet_address
-                logger.info(f"✅ Using proxy address (funder): {wallet_address[:10]}...")
+            if self._wallet_address:
+                client_kwargs["funder"] = self._wallet_address
+                logger.info(f"✅ Using proxy address (funder): {self._wallet_address[:10]}...")
             
             self.client = ClobClient(**client_kwargs)
             
+            if self.config.signing_processes > 0 and private_key:
+                # EIP-712 signing is CPU-bound; worker processes keep it off the GIL
+                self._sign_pool = ProcessPoolExecutor(
+                    max_workers=self.config.signing_processes,
+                    initializer=_init_signer,
+                    initargs=(client_kwargs,),
+                )
+                logger.info(f"Signing orders in {self.config.signing_processes} worker processes")
+            
             # Set API credentials (derived from private key - matches working implementation)
             # This creates or derives API credentials for authentication
             try:
@@ -100,6 +423,12 @@ class PolymarketService:
                 logger.warning("⚠️ Order submission may fail, but read operations (orderbook) should still work")
                 logger.debug(f"API credentials error details: {type(creds_error).__name__}: {creds_error}")
             
+            try:
+                self._client_address = self.client.get_address()
+            except Exception as address_error:
+                # No private key (read-only client) has no signer address
+                logger.debug(f"Could not get address from client: {address_error}")
+            
             logger.info(f"✅ Polymarket service initialized successfully - REAL TRADING MODE (host: {host})")
         except Exception as e:
             logger.error(f"❌ Failed to initialize CLOB client: {e}")
@@ -108,30 +437,343 @@ class PolymarketService:
             logger.error(traceback.format_exc())
             self.client = None
     
+    async def _run_blocking(self, func, *args):
+        """Run a blocking CLOB client call on the service's executor."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+    
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+        
+        Reusing one session keeps connections (and TLS sessions) to the
+        Data API alive between position checks.
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.config.request_timeout_seconds),
+            )
+        return self._http
+    
+    async def _post_order_batch(self, signed_orders: List[Any]) -> List[Any]:
+        """Post signed GTC orders in one request.
+        
+        Returns one response per order, or a PolymarketServiceError for each
+        order the CLOB rejected.
+        """
+        if len(signed_orders) == 1:
+            results = [await self._run_blocking(self.client.post_order, signed_orders[0], OrderType.GTC)]
+        else:
+            args = [PostOrdersArgs(order=order, orderType=OrderType.GTC) for order in signed_orders]
+            results = await self._run_blocking(self.client.post_orders, args)
+        return [
+            PolymarketServiceError(f"Order rejected: {rejection}") if (rejection := _order_rejection(result)) else result
+            for result in results
+        ]
+    
+    async def _cancel_order_batch(self, order_ids: List[str]) -> List[Any]:
+        """Cancel orders in one request.
+        
+        Each caller receives the part of the response for its own id, or a
+        PolymarketServiceError if the CLOB did not cancel it.
+        """
+        if len(order_ids) == 1:
+            result = await self._run_blocking(self.client.cancel, order_ids[0])
+        else:
+            result = await self._run_blocking(self.client.cancel_orders, order_ids)
+        return _split_cancel_response(result, order_ids)
+    
+    # ========================================================================
+    # Orderbook stream
+    # ========================================================================
+    
+    def _seed_book(self, token_id: str, book: OrderBook) -> None:
+        """Store a REST orderbook snapshot as the base for stream updates.
+        
+        Only seeded while the stream is connected: a book seeded while it is
+        down would get no updates and go stale.
+        """
+        self._book_min_order_size[token_id] = book.min_order_size
+        if self._ws is None:
+            return
+        if token_id not in self._books:  # A stream snapshot is at least as fresh
+            self._books[token_id] = {
+                "bids": dict(zip(book.bid_px, book.bid_sz)),
+                "asks": dict(zip(book.ask_px, book.ask_sz)),
+            }
+    
+    async def _subscribe_book(self, token_id: str) -> None:
+        """Add a token to the market stream, starting it as needed."""
+        if token_id in self._stream_tokens:
+            return
+        self._stream_tokens.add(token_id)
+        if self._ws_task is None or self._ws_task.done():
+            self._ws_task = asyncio.create_task(self._stream_books())
+        elif self._ws is not None:
+            # Subscribe on the open socket; a connect in progress sends the full set
+            try:
+                await self._ws.send_json({"assets_ids": [token_id], "operation": "subscribe"})
+            except Exception as e:
+                logger.warning(f"Orderbook stream subscribe failed for {token_id[:20]}...: {e}")
+    
+    async def _ws_connect(self, session: aiohttp.ClientSession, url: str) -> aiohttp.ClientWebSocketResponse:
+        """Open a WebSocket, giving up after request_timeout_seconds."""
+        return await asyncio.wait_for(
+            session.ws_connect(url, heartbeat=WS_HEARTBEAT_SECONDS),
+            timeout=self.config.request_timeout_seconds,
+        )
+    
+    async def _stream_books(self) -> None:
+        """Keep self._books current from the market WebSocket, reconnecting on errors."""
+        while True:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with await self._ws_connect(session, MARKET_WS_URL) as ws:
+                        subscribed = set(self._stream_tokens)
+                        await ws.send_json({"type": "market", "assets_ids": sorted(subscribed)})
+                        self._ws = ws  # Tokens added from here on are subscribed incrementally
+                        missed = self._stream_tokens - subscribed
+                        if missed:
+                            await ws.send_json({"assets_ids": sorted(missed), "operation": "subscribe"})
+                        logger.info(f"Orderbook stream subscribed to {len(self._stream_tokens)} tokens")
+                        async for msg in ws:
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                self._apply_book_message(msg.data)
+                            elif msg.type == aiohttp.WSMsgType.ERROR:
+                                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Orderbook stream error: {type(e).__name__}: {e}")
+            finally:
+                self._ws = None
+                # Without the stream the books go stale; reads fall back to REST until it reconnects
+                self._books.clear()
+                self._book_snapshots.clear()
+            
+            await asyncio.sleep(WS_RECONNECT_DELAY_SECONDS)
+    
+    def _apply_book_message(self, data: str) -> None:
+        """Apply a market channel message (book snapshot or price changes)."""
+        try:
+            events = _json_loads(data)
+        except ValueError:
+            return  # Non-JSON control frames such as PONG
+        if isinstance(events, dict):
+            events = [events]
+        
+        for event in events:
+            event_type = event.get("event_type")
+            if event_type == "book":
+                token_id = event.get("asset_id")
+                if token_id in self._stream_tokens:
+                    self._book_snapshots.pop(token_id, None)
+                    self._books[token_id] = {
+                        "bids": {float(level["price"]): float(level["size"]) for level in event.get("bids") or event.get("buys") or []},
+                        "asks": {float(level["price"]): float(level["size"]) for level in event.get("asks") or event.get("sells") or []},
+                    }
+            elif event_type == "price_change":
+                for change in event.get("price_changes") or event.get("changes") or []:
+                    token_id = change.get("asset_id") or event.get("asset_id")
+                    book = self._books.get(token_id)
+                    if book is None:
+                        continue
+                    self._book_snapshots.pop(token_id, None)
+                    levels = book["bids"] if change.get("side", "").upper() == "BUY" else book["asks"]
+                    price = float(change["price"])
+                    size = float(change["size"])
+                    if size == 0:
+                        levels.pop(price, None)
+                    else:
+                        levels[price] = size
+    
+    # ========================================================================
+    # User stream
+    # ========================================================================
+    
+    def _user_stream_auth(self) -> Optional[Dict[str, str]]:
+        """Return user channel credentials from config, else the client's derived ones."""
+        if self.config.api_key and self.config.api_secret and self.config.api_passphrase:
+            return {
+                "apiKey": self.config.api_key,
+                "secret": self.config.api_secret,
+                "passphrase": self.config.api_passphrase,
+            }
+        creds = getattr(self.client, "creds", None)
+        if creds is not None and creds.api_key and creds.api_secret and creds.api_passphrase:
+            return {
+                "apiKey": creds.api_key,
+                "secret": creds.api_secret,
+                "passphrase": creds.api_passphrase,
+            }
+        return None
+    
+    def _start_user_stream(self) -> None:
+        """Start the user channel stream once, if enabled and credentials are available."""
+        if self._user_ws_task is not None or not self.config.user_stream_enabled:
+            return
+        auth = self._user_stream_auth()
+        if auth is None:
+            return
+        self._user_ws_task = asyncio.create_task(self._stream_user_events(auth))
+    
+    async def _stream_user_events(self, auth: Dict[str, str]) -> None:
+        """Invalidate position/open-order caches on our trades and order updates.
+        
+        Reconnects on errors; while disconnected, positions fall back to
+        read_cache_ttl_seconds polling.
+        """
+        while True:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with await self._ws_connect(session, USER_WS_URL) as ws:
+                        await ws.send_json({"type": "user", "auth": auth, "markets": []})
+                        # Fills may have been missed while disconnected
+                        self._position_cache.clear()
+                        self._last_position_event = time.monotonic()
+                        self._user_stream_live = True
+                        logger.info("User stream connected")
+                        async for msg in ws:
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                self._apply_user_message(msg.data)
+                            elif msg.type == aiohttp.WSMsgType.ERROR:
+                                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"User stream error: {type(e).__name__}: {e}")
+            finally:
+                self._user_stream_live = False
+            
+            await asyncio.sleep(WS_RECONNECT_DELAY_SECONDS)
+    
+    def _apply_user_message(self, data: str) -> None:
+        """Drop cached reads made stale by a user channel trade or order event."""
+        try:
+            events = _json_loads(data)
+        except ValueError:
+            return  # Non-JSON control frames such as PONG
+        if isinstance(events, dict):
+            events = [events]
+        
+        for event in events:
+            event_type = event.get("event_type")
+            if event_type == "trade":
+                self._position_cache.clear()
+                self._last_position_event = time.monotonic()
+                self._invalidate_order_reads(event.get("asset_id"))
+            elif event_type == "order":
+                self._invalidate_order_reads(event.get("asset_id"))
+    
+    async def close(self) -> None:
+        """Release resources held by the service."""
+        for task in (self._ws_task, self._user_ws_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for batcher in (self._order_batcher, self._cancel_batcher):
+            if batcher is not None:
+                await batcher.close()
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._sign_pool is not None:
+            self._sign_pool.shutdown(wait=False, cancel_futures=True)
+    
+    async def _cached_read(
+        self,
+        cache: Dict[str, Tuple[float, asyncio.Task]],
+        key: str,
+        fetch: Callable[[str], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Return fetch(key), sharing one request among callers within the read TTL.
+        
+        Concurrent callers await the same in-flight task, and its result is
+        reused until ttl (default read_cache_ttl_seconds) has passed since it
+        started. Failed fetches are not cached.
+        """
+        if ttl is None:
+            ttl = self.config.read_cache_ttl_seconds
+        if ttl <= 0:
+            return await fetch(key)
+        
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is None or now - entry[0] >= ttl:
+            task = asyncio.ensure_future(fetch(key))
+            cache[key] = (now, task)
+        else:
+            task = entry[1]
+        
+        try:
+            # Shield so one cancelled caller doesn't cancel the shared fetch
+            return await asyncio.shield(task)
+        except Exception:
+            if cache.get(key, (None, None))[1] is task:
+                del cache[key]
+            raise
+    
+    def _invalidate_order_reads(self, token_id: Optional[str] = None) -> None:
+        """Drop cached open orders after this service changed them."""
+        if token_id is None:
+            self._open_orders_cache.clear()
+        else:
+            self._open_orders_cache.pop(token_id, None)
+    
+    def _track_submission(self, order_id: str, submission_time: float) -> None:
+        """Record an order's submission time, evicting entries past the max age.
+        
+        Entries are inserted in time order, so expired ones are at the front.
+        """
+        tracker = self._latency_tracker
+        cutoff = submission_time - LATENCY_TRACKER_MAX_AGE_SECONDS
+        while tracker:
+            oldest_id = next(iter(tracker))
+            if tracker[oldest_id] >= cutoff:
+                break
+            del tracker[oldest_id]
+        tracker[sys.intern(str(order_id))] = submission_time
+    
     def _round_price(self, price: float) -> float:
-        """Round price to valid Polymarket tick size."""
-        # Polymarket typically uses 0.01 tick size (1 cent)
-        # Adjust based on actual requirements
-        tick_size = 0.01
-        return round(price / tick_size) * tick_size
+        """Round price to the nearest valid Polymarket tick (PRICE_TICK).
+        
+        Quantizes in decimal from the float's shortest repr, so halves round
+        up (0.565 -> 0.57) instead of following the float's binary value or
+        round()'s half-to-even rule.
+        """
+        return float(Decimal(repr(price)).quantize(PRICE_TICK, rounding=ROUND_HALF_UP))
     
     def _round_size(self, size: float) -> float:
         """Round size to valid precision."""
         return round(size, self.config.size_precision)
     
     async def _retry_operation(self, operation, *args, **kwargs):
-        """Retry an operation with exponential backoff."""
+        """Retry an operation with jittered exponential backoff.
+        
+        Each delay is drawn uniformly from [0, retry_delay * 2**attempt],
+        capped at RETRY_MAX_DELAY_SECONDS, so concurrent traders don't retry
+        in lockstep. Non-retryable errors (4xx responses) fail immediately.
+        """
         last_exception = None
         for attempt in range(self.config.max_retries):
             try:
                 return await operation(*args, **kwargs)
             except Exception as e:
                 last_exception = e
+                if not _is_retryable(e):
+                    logger.error(f"Operation failed with non-retryable error: {e}")
+                    break
                 if attempt < self.config.max_retries - 1:
-                    delay = self.config.retry_delay_seconds * (2 ** attempt)
+                    delay = random.uniform(
+                        0, min(RETRY_MAX_DELAY_SECONDS, self.config.retry_delay_seconds * (2 ** attempt))
+                    )
                     logger.warning(
                         f"Operation failed (attempt {attempt + 1}/{self.config.max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
+                        f"Retrying in {delay:.2f}s..."
                     )
                     await asyncio.sleep(delay)
                 else:
@@ -139,25 +781,70 @@ class PolymarketService:
         
         raise PolymarketServiceError(f"Operation failed: {last_exception}")
     
+    async def get_book(self, token_id: str) -> OrderBook:
+        """Fetch the orderbook for a token.
+        
+        Once a token has been fetched over REST it is subscribed to the market
+        WebSocket, and while the stream is connected later reads are served from
+        the locally maintained book (re-sorted only after a stream update touched
+        it). REST reads within read_cache_ttl_seconds of each other share one request.
+        
+        Args:
+            token_id: Token ID (not condition ID) - required by Polymarket API
+        """
+        if self._ws is None:
+            return await self._cached_read(self._orderbook_cache, token_id, self._fetch_orderbook)
+        snapshot = self._book_snapshots.get(token_id)
+        if snapshot is not None:
+            return snapshot
+        levels = self._books.get(token_id)
+        if levels is not None:
+            snapshot = OrderBook.from_levels(levels["bids"], levels["asks"], self._book_min_order_size.get(token_id))
+            self._book_snapshots[token_id] = snapshot
+            return snapshot
+        return await self._cached_read(self._orderbook_cache, token_id, self._fetch_orderbook)
+    
     async def get_orderbook(self, token_id: str) -> Dict:
-        """Fetch orderbook for a token.
+        """Fetch orderbook for a token in the REST dict format.
+        
+        Prefer get_book(), which avoids building a dict per price level.
         
         Args:
             token_id: Token ID (not condition ID) - required by Polymarket API
         """
+        return (await self.get_book(token_id)).to_dict()
+    
+    async def get_books(self, token_ids: List[str]) -> Dict[str, OrderBook]:
+        """Fetch orderbooks for several tokens concurrently.
+        
+        At most max_concurrent_requests fetches are in flight at once.
+        
+        Args:
+            token_ids: Token IDs to fetch
+            
+        Returns:
+            Dict of token_id -> OrderBook
+            
+        Raises:
+            PolymarketServiceError: If any fetch fails
+        """
+        async def _fetch_one(token_id: str) -> Tuple[str, OrderBook]:
+            async with self._fetch_semaphore:
+                return token_id, await self.get_book(token_id)
+        
+        return dict(await asyncio.gather(*map(_fetch_one, token_ids)))
+    
+    async def _fetch_orderbook(self, token_id: str) -> OrderBook:
+        """Fetch orderbook for a token from the CLOB, bypassing the read cache."""
         if self.client is None:
             # Mock response for testing
             logger.warning(f"Using MOCK orderbook data for token {token_id}")
-            return {
-                "bids": [{"price": "0.50", "size": "100"}],
-                "asks": [{"price": "0.51", "size": "100"}],
-            }
+            return OrderBook((0.50,), (100.0,), (0.51,), (100.0,))
         
         async def _fetch():
-            # Use asyncio.to_thread for cleaner async handling (matches working implementation)
             # Note: get_order_book doesn't require API credentials, just a valid client
             try:
-                return await asyncio.to_thread(self.client.get_order_book, token_id)
+                return await self._run_blocking(self.client.get_order_book, token_id)
             except Exception as e:
                 # Log more details about the error
                 logger.error(f"get_order_book failed for token {token_id[:20]}...: {type(e).__name__}: {e}")
@@ -166,57 +853,55 @@ class PolymarketService:
         try:
             orderbook_obj = await self._retry_operation(_fetch)
             
-            # Convert OrderBookSummary to dict format expected by trader
-            # OrderBookSummary has bids/asks as lists of OrderSummary objects
-            orderbook = {
-                "bids": [],
-                "asks": [],
-                "min_order_size": None,  # Market-specific minimum order size
-            }
-            
-            # Extract min_order_size from OrderBookSummary if available
-            if hasattr(orderbook_obj, 'min_order_size') and orderbook_obj.min_order_size:
+            # Extract min_order_size (market-specific minimum order size) if available
+            min_order_size = None
+            if getattr(orderbook_obj, 'min_order_size', None):
                 try:
-                    orderbook["min_order_size"] = float(orderbook_obj.min_order_size)
+                    min_order_size = float(orderbook_obj.min_order_size)
                 except (ValueError, TypeError):
                     pass  # Keep as None if can't parse
             
-            if orderbook_obj.bids:
-                for bid in orderbook_obj.bids:
-                    # OrderSummary has 'price' and 'size' attributes
-                    orderbook["bids"].append({
-                        "price": str(bid.price),
-                        "size": str(bid.size),
-                    })
-            
-            if orderbook_obj.asks:
-                for ask in orderbook_obj.asks:
-                    orderbook["asks"].append({
-                        "price": str(ask.price),
-                        "size": str(ask.size),
-                    })
+            # OrderBookSummary has bids/asks as lists of OrderSummary objects,
+            # normally ordered with the best level last
+            bids = orderbook_obj.bids or ()
+            asks = orderbook_obj.asks or ()
+            # map() keeps the per-level parse loop out of Python bytecode
+            book = OrderBook(
+                tuple(map(float, map(_get_price, bids))),
+                tuple(map(float, map(_get_size, bids))),
+                tuple(map(float, map(_get_price, asks))),
+                tuple(map(float, map(_get_size, asks))),
+                min_order_size,
+            )
+            if not book.is_ordered():
+                # Don't let an ordering change in the API flip best and worst levels
+                logger.warning(f"Token {token_id[:20]}... - Orderbook levels out of order, sorting")
+                book = OrderBook.from_levels(
+                    dict(zip(book.bid_px, book.bid_sz)), dict(zip(book.ask_px, book.ask_sz)), min_order_size
+                )
             
             # Log for debugging
-            # Note: Orderbook is sorted reverse - best bid/ask are LAST elements
-            if orderbook["bids"]:
-                best_bid = float(orderbook['bids'][-1]['price'])  # Last element = highest bid
-                best_ask = float(orderbook['asks'][-1]['price']) if orderbook['asks'] else None  # Last element = lowest ask
-                spread = best_ask - best_bid if best_ask else None
-                if best_ask:
+            best_bid = book.best_bid()
+            best_ask = book.best_ask()
+            if best_bid is None and best_ask is None:
+                logger.warning(f"Token {token_id[:20]}... - Empty orderbook")
+            elif logger.isEnabledFor(logging.INFO):  # Skip the cents formatting when INFO is off
+                if best_ask is None:
+                    logger.info(f"Token {token_id[:20]}... - Best Bid: {best_bid*100:.0f} cents, No asks")
+                elif best_bid is None:
+                    logger.info(f"Token {token_id[:20]}... - Best Ask: {best_ask*100:.0f} cents, No bids")
+                else:
                     logger.info(
                         f"Token {token_id[:20]}... - Best Bid: {best_bid*100:.0f} cents, "
                         f"Best Ask: {best_ask*100:.0f} cents, "
-                        f"Spread: {spread*100:.0f} cents"
+                        f"Spread: {(best_ask - best_bid)*100:.0f} cents"
                     )
-                else:
-                    logger.info(f"Token {token_id[:20]}... - Best Bid: {best_bid*100:.0f} cents, No asks")
-            elif orderbook["asks"]:
-                best_ask = float(orderbook['asks'][-1]['price'])
-                logger.info(f"Token {token_id[:20]}... - Best Ask: {best_ask*100:.0f} cents, No bids")
-            else:
-                logger.warning(f"Token {token_id[:20]}... - Empty orderbook")
             
-            return orderbook
+            if self.config.orderbook_stream_enabled:
+                self._seed_book(token_id, book)
+                await self._subscribe_book(token_id)
+            
+            return book
         except Exception as e:
             logger.error(f"Failed to fetch orderbook for token {token_id}: {e}")
             raise PolymarketServiceError(f"Orderbook fetch failed: {e}")
@@ -227,8 +912,18 @@ class PolymarketService:
         price: float,
         size: float,
         token_id: str,  # Token ID (not condition ID)
+        signed_order: Any = None,
     ) -> str:
-        """Submit a limit order and return order ID."""
+        """Submit a limit order and return order ID.
+        
+        Args:
+            side: "BUY" or "SELL"
+            price: Price in decimal
+            size: Size in shares
+            token_id: Token ID (not condition ID)
+            signed_order: Order already signed by _sign_limit() for these
+                values; posted on the first attempt instead of signing again
+        """
         if self.client is None:
             # Mock order ID for testing
             order_id = f"mock_{int(time.time() * 1000)}"
@@ -241,80 +936,122 @@ class PolymarketService:
         async def _submit():
             # Use the working pattern: create_order + post_order (separate steps)
             # This matches the successful implementation
+            nonlocal signed_order
             
-            if not CLOB_AVAILABLE or OrderArgs is None or OrderType is None or BUY is None or SELL is None:
-                raise PolymarketServiceError("py_clob_client not properly imported")
-            
-            # Determine side constant (BUY or SELL from py_clob_client)
-            order_side = BUY if side.upper() == "BUY" else SELL
-            
-            # Build order args
-            order_args = OrderArgs(
-                price=rounded_price,
-                size=rounded_size,
-                side=order_side,
-                token_id=token_id
-            )
-            
-            # Step 1: Create and sign order
-            signed_order = await asyncio.to_thread(self.client.create_order, order_args)
-            
-            # Step 2: Post order as GTC (Good-Till-Cancelled)
-            resp = await asyncio.to_thread(self.client.post_order, signed_order, OrderType.GTC)
+            # Step 1: Create and sign order (retries sign afresh)
+            if signed_order is None:
+                order = await self._sign_limit(side, rounded_price, rounded_size, token_id)
+            else:
+                order, signed_order = signed_order, None
             
+            # Step 2: Post order as GTC (Good-Till-Cancelled), batched with concurrent submissions
+            if self._order_batcher is not None:
+                return await self._order_batcher.submit(order)
+            resp = await self._run_blocking(self.client.post_order, order, OrderType.GTC)
+            rejection = _order_rejection(resp)
+            if rejection:
+                raise PolymarketServiceError(f"Order rejected: {rejection}")
             return resp
         
         try:
-            submission_time = time.time()
+            submission_time = time.monotonic()
             result = await self._retry_operation(_submit)
             
             # Extract order ID from result
             # post_order returns a dict with orderID field (capital ID)
-            if isinstance(result, dict):
-                # Try common order ID field names (orderID with capital ID is what Polymarket uses)
-                order_id = (
-                    result.get("orderID")  # Capital ID - this is what Polymarket actually returns
-                    or result.get("orderId")  # camelCase variant
-                    or result.get("order_id")  # snake_case variant
-                    or result.get("id") 
-                    or result.get("hash")
-                    or result.get("orderHash")
-                    or result.get("order_hash")
-                )
-            elif hasattr(result, "__dict__"):
-                # If it's an object with attributes
-                order_id = (
-                    getattr(result, "orderID", None)  # Capital ID - this is what Polymarket actually returns
-                    or getattr(result, "orderId", None)  # camelCase variant
-                    or getattr(result, "order_id", None) 
-                    or getattr(result, "id", None) 
-                    or getattr(result, "hash", None)
-                    or getattr(result, "orderHash", None)
-                )
-            else:
-                order_id = None
+            order_id = _extract_field(result, ORDER_ID_FIELDS)
             
             if not order_id:
-                # Last resort: use a hash of the order data
-                import hashlib
-                order_str = f"{token_id}_{side}_{rounded_price}_{rounded_size}_{submission_time}"
-                order_id = hashlib.sha256(order_str.encode()).hexdigest()[:16]
-                logger.warning(
-                    f"Could not extract order_id from result type {type(result)}, "
-                    f"using hash: {order_id}. Result: {result}"
-                )
+                # Without an id the order can't be tracked or cancelled; don't report it as placed
+                raise PolymarketServiceError(f"No order_id in response ({type(result).__name__}): {result}")
             
-            self._latency_tracker[order_id] = submission_time
+            self._track_submission(order_id, submission_time)
+            self._invalidate_order_reads(token_id)
             
-            logger.info(
-                f"Submitted {side} order: {order_id} - {rounded_size} @ {rounded_price} "
-                f"for token {token_id}"
+            # The trader logs the placement at INFO
+            logger.debug(
+                "Submitted %s order: %s - %s @ %s for token %s",
+                side, order_id, rounded_size, rounded_price, token_id,
             )
             return str(order_id)
         except Exception as e:
             logger.error(f"Failed to submit {side} order: {e}")
             raise PolymarketServiceError(f"Order submission failed: {e}")
     
+    async def _sign_limit(self, side: str, rounded_price: float, rounded_size: float, token_id: str) -> Any:
+        """Create and sign a limit order (no network I/O)."""
+        if not CLOB_AVAILABLE or OrderArgs is None or OrderType is None or BUY is None or SELL is None:
+            raise PolymarketServiceError("py_clob_client not properly imported")
+        
+        # Determine side constant (BUY or SELL from py_clob_client)
+        order_side = BUY if side.upper() == "BUY" else SELL
+        
+        # Build order args
+        order_args = OrderArgs(
+            price=rounded_price,
+            size=rounded_size,
+            side=order_side,
+            token_id=token_id
+        )
+        
+        if self._sign_pool is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._sign_pool, _sign_order, order_args
+            )
+        return await self._run_blocking(self.client.create_order, order_args)
+    
+    async def replace_order(
+        self,
+        old_order_id: str,
+        side: str,
+        price: float,
+        size: float,
+        token_id: str,
+        settle_delay: float = 0.0,
+    ) -> str:
+        """Cancel an order and submit its replacement, returning the new order ID.
+        
+        The CLOB has no amend endpoint, so this is still cancel + post, but
+        the replacement is signed while the cancel is in flight. The post
+        waits for the cancel so the old order's shares/collateral are free.
+        
+        Args:
+            old_order_id: ID of the order to cancel
+            side: "BUY" or "SELL"
+            price: New price in decimal
+            size: New size in shares
+            token_id: Token ID (not condition ID)
+            settle_delay: Seconds to wait between cancel and post
+            
+        Raises:
+            PolymarketServiceError: If the cancel or the submission fails
+        """
+        if self.client is None:
+            await self.cancel(old_order_id)
+            return await self.submit_limit(side, price, size, token_id)
+        
+        sign_task = asyncio.ensure_future(
+            self._sign_limit(side, self._round_price(price), self._round_size(size), token_id)
+        )
+        try:
+            await self.cancel(old_order_id)
+            if settle_delay > 0:
+                await asyncio.sleep(settle_delay)
+        except BaseException:
+            sign_task.cancel()
+            # Retrieve a signing error that already happened so it isn't reported as unhandled
+            if sign_task.done() and not sign_task.cancelled():
+                sign_task.exception()
+            raise
+        
+        try:
+            signed_order = await sign_task
+        except Exception as e:
+            # submit_limit signs again, with retries
+            logger.warning(f"Pre-signing replacement {side} order failed: {e}")
+            signed_order = None
+        return await self.submit_limit(side, price, size, token_id, signed_order=signed_order)
+    
     async def get_order_status(self, order_id: str) -> Dict:
         """Get status of an order."""
         if self.client is None:
@@ -327,8 +1064,7 @@ class PolymarketService:
             }
         
         async def _fetch():
-            # Use asyncio.to_thread for cleaner async handling
-            return await asyncio.to_thread(self.client.get_order, order_id)
+            return await self._run_blocking(self.client.get_order, order_id)
         
         try:
             status = await self._retry_operation(_fetch)
@@ -358,10 +1094,10 @@ class PolymarketService:
                     }
             
             # Track latency if order is filled
-            if order_id in self._latency_tracker and status.get("status") == "FILLED":
-                latency = time.time() - self._latency_tracker[order_id]
-                logger.info(f"Order {order_id} filled in {latency:.3f}s")
-                del self._latency_tracker[order_id]
+            if status.get("status") == "FILLED":
+                submission_time = self._latency_tracker.pop(order_id, None)
+                if submission_time is not None:
+                    logger.info(f"Order {order_id} filled in {time.monotonic() - submission_time:.3f}s")
             
             return status
         except Exception as e:
@@ -375,27 +1111,70 @@ class PolymarketService:
             return True
         
         async def _cancel():
-            # Use asyncio.to_thread for cleaner async handling
-            return await asyncio.to_thread(self.client.cancel, order_id)
+            if self._cancel_batcher is not None:
+                return await self._cancel_batcher.submit(order_id)
+            result = _split_cancel_response(await self._run_blocking(self.client.cancel, order_id), [order_id])[0]
+            if isinstance(result, Exception):
+                raise result
+            return result
         
         try:
             result = await self._retry_operation(_cancel)
-            logger.info(f"Cancelled order {order_id}")
+            logger.debug("Cancelled order %s", order_id)
+            self._invalidate_order_reads()
             
             # Clean up latency tracker
-            if order_id in self._latency_tracker:
-                del self._latency_tracker[order_id]
+            self._latency_tracker.pop(order_id, None)
             
             return result
         except Exception as e:
             logger.error(f"Failed to cancel order {order_id}: {e}")
             raise PolymarketServiceError(f"Order cancellation failed: {e}")
     
+    async def cancel_many(self, order_ids: List[str]) -> Any:
+        """Cancel several orders in a single request.
+        
+        Uses the CLOB batch cancel endpoint; falls back to concurrent single
+        cancels if the client has no cancel_orders.
+        
+        Args:
+            order_ids: Order IDs to cancel
+        """
+        if not order_ids:
+            return None
+        if self.client is None:
+            logger.info(f"Mock cancel for {len(order_ids)} orders")
+            return True
+        
+        if not hasattr(self.client, "cancel_orders"):
+            return await asyncio.gather(*(self.cancel(order_id) for order_id in order_ids))
+        
+        async def _cancel():
+            return await self._run_blocking(self.client.cancel_orders, order_ids)
+        
+        try:
+            result = await self._retry_operation(_cancel)
+            logger.info(f"Cancelled {len(order_ids)} orders")
+            self._invalidate_order_reads()
+            for order_id in order_ids:
+                self._latency_tracker.pop(order_id, None)
+            return result
+        except Exception as e:
+            logger.error(f"Failed to cancel {len(order_ids)} orders: {e}")
+            raise PolymarketServiceError(f"Batch order cancellation failed: {e}")
+    
     async def get_market_position(self, token_id: str) -> float:
         """Get position size for a specific token directly from Polymarket Data API.
         
         Uses the Polymarket Data API /positions endpoint to get the actual position
         for the token. This is more accurate and faster than calculating from trades.
+        One positions request covers every token of the wallet: the response is
+        indexed by asset and shared by all reads within read_cache_ttl_seconds.
+        While the user stream is connected, positions only change through our
+        own fills, which drop the cache, so the response is kept for up to
+        position_max_age_seconds instead. The Data API lags fills, so for
+        position_max_age_seconds after a fill (or a reconnect) reads keep the
+        short TTL until the reported size has caught up.
         
         Args:
             token_id: Token ID to check position for
@@ -407,99 +1186,91 @@ class PolymarketService:
             logger.debug(f"Position check for token {token_id} - client not available, returning 0.0")
             return 0.0
         
+        # Get wallet address from config or client
+        # For Polymarket, we might need the proxy wallet (funder) if using email/magic accounts:
+        # prefer it (this is what Polymarket uses for positions), else the client's signer address
+        wallet_address = self._wallet_address or self._client_address
+        if not wallet_address:
+            logger.warning("Cannot get position: wallet address not available from client or config")
+            return 0.0
+        
+        self._start_user_stream()
+        ttl = None
+        max_age = self.config.position_max_age_seconds
+        if self._user_stream_live and (
+            self._last_position_event is None
+            or time.monotonic() - self._last_position_event >= max_age
+        ):
+            ttl = max_age
         try:
-            # Get wallet address from client or config
-            # For Polymarket, we might need the proxy wallet (funder) if using email/magic accounts
-            wallet_address = None
-            
-            # Try to get proxy wallet (funder) first - this is what Polymarket uses for positions
-            if hasattr(self.config, 'wallet_address') and self.config.wallet_address:
-                wallet_address = self.config.wallet_address.strip('"').strip("'")
-                logger.debug(f"Using wallet address from config: {wallet_address[:10]}...")
-            
-            # Fallback to client's address
-            if not wallet_address and hasattr(self.client, 'get_address'):
-                try:
-                    wallet_address = await asyncio.to_thread(self.client.get_address)
-                    logger.debug(f"Using wallet address from client: {wallet_address[:10]}...")
-                except Exception as e:
-                    logger.debug(f"Could not get address from client: {e}")
-            
-            if not wallet_address:
-                logger.warning("Cannot get position: wallet address not available from client or config")
-                return 0.0
-            
-            # Use Polymarket Data API to get positions directly
-            async def _fetch_position():
-                url = "https://data-api.polymarket.com/positions"
-                params = {
-                    "user": wallet_address,
-                    "sizeThreshold": 0.0  # Get all positions, even small ones
-                }
-                
-                logger.debug(f"Fetching positions from API for wallet {wallet_address[:10]}... and token {token_id[:20]}...")
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        url,
-                        params=params,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        response.raise_for_status()
-                        positions = await response.json()
-                        logger.debug(f"Received {len(positions)} positions from API")
-                        return positions
-            
-            positions = await self._retry_operation(_fetch_position)
-            
-            if not positions:
-                logger.debug(f"No positions returned from API for wallet {wallet_address[:10]}...")
-                return 0.0
-            
-            # Log positions for debugging (only if we have many positions or if debug is enabled)
-            if len(positions) > 0:
-                logger.debug(f"Searching for token {token_id[:20]}... in {len(positions)} positions")
-                # Only log positions if debug level is enabled (to reduce noise)
-                if logger.isEnabledFor(logging.DEBUG):
-                    for pos in positions[:3]:  # Log first 3 for debugging
-                        logger.debug(f"  Position asset: {pos.get('asset', 'N/A')[:20]}..., size: {pos.get('size', 'N/A')}")
-            
-            # Find position for this specific token
-            # The asset field should match the token_id (token contract address)
-            for position in positions:
-                asset = position.get("asset", "")
-                # Normalize both to lowercase for comparison (addresses are case-insensitive)
-                asset_normalized = asset.lower().strip()
-                token_id_normalized = token_id.lower().strip()
-                
-                # Check if this position matches our token_id
-                if asset_normalized == token_id_normalized:
-                    size = position.get("size", 0.0)
-                    try:
-                        position_size = float(size)
-                        logger.info(f"✅ Found position for token {token_id[:20]}...: {position_size:.2f} shares")
-                        return position_size
-                    except (ValueError, TypeError):
-                        logger.warning(f"Could not parse position size: {size}")
-                        continue
-            
-            # Token not found in positions - this is normal if there's no position
-            # Only log as debug (not warning) since having no position is a valid state
-            logger.debug(
-                f"Token {token_id[:20]}... not found in positions (position = 0). "
-                f"Available assets: {[p.get('asset', '')[:20] for p in positions[:5]]}"
+            positions_by_asset = await self._cached_read(
+                self._position_cache, wallet_address, self._fetch_positions_by_asset, ttl
             )
-            return 0.0
-            
         except Exception as e:
             logger.warning(f"Failed to get position for token {token_id} from API: {e}")
             # Fall back to 0.0 - trader will rely on self-tracking
-        return 0.0
+            return 0.0
+        
+        # Asset ids are normalized to lowercase (addresses are case-insensitive)
+        position_size = positions_by_asset.get(token_id.lower().strip())
+        if position_size is None:
+            # Token not found in positions - this is normal if there's no position
+            # Only log as debug (not warning) since having no position is a valid state
+            logger.debug(f"Token {token_id[:20]}... not found in positions (position = 0)")
+            return 0.0
+        
+        logger.debug("Found position for token %.20s...: %.2f shares", token_id, position_size)
+        return position_size
+    
+    async def _fetch_positions_by_asset(self, wallet_address: str) -> Dict[str, float]:
+        """Fetch all positions of a wallet from the Data API, bypassing the read cache.
+        
+        Returns:
+            Dict of normalized (lowercase) asset id -> position size
+        """
+        # Use Polymarket Data API to get positions directly
+        async def _fetch_position():
+            url = "https://data-api.polymarket.com/positions"
+            params = {
+                "user": wallet_address,
+                "sizeThreshold": 0.0  # Get all positions, even small ones
+            }
+            
+            logger.debug(f"Fetching positions from API for wallet {wallet_address[:10]}...")
+            
+            session = await self._get_http()
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                positions = _json_loads(await response.read())
+                logger.debug(f"Received {len(positions)} positions from API")
+                return positions
+        
+        positions = await self._retry_operation(_fetch_position)
+        
+        positions_by_asset: Dict[str, float] = {}
+        for position in positions or ():
+            asset = position.get("asset")
+            if not asset:
+                continue
+            size = position.get("size", 0.0)
+            try:
+                positions_by_asset[asset.lower().strip()] = float(size)
+            except (ValueError, TypeError):
+                logger.warning(f"Could not parse position size: {size}")
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Indexed {len(positions_by_asset)} positions for wallet {wallet_address[:10]}... "
+                f"(first assets: {[asset[:20] for asset in list(positions_by_asset)[:5]]})"
+            )
+        return positions_by_asset
     
     async def get_my_open_orders(self, token_id: str) -> List[Dict]:
         """Get my open orders for a specific token.
         
         Uses Polymarket's get_orders API to fetch all open orders and filters by token_id.
+        Reads within read_cache_ttl_seconds of each other share one request; the
+        cache is dropped whenever this service submits or cancels an order.
         
         Args:
             token_id: Token ID to filter orders for
@@ -507,20 +1278,23 @@ class PolymarketService:
         Returns:
             List of order dicts with: id, side, price, size, etc.
         """
+        return await self._cached_read(self._open_orders_cache, token_id, self._fetch_my_open_orders)
+    
+    async def _fetch_my_open_orders(self, token_id: str) -> List[Dict]:
+        """Fetch my open orders for a token from the CLOB, bypassing the read cache."""
         if self.client is None:
             logger.debug(f"get_my_open_orders for token {token_id} - client not available, returning empty list")
             return []
         
         try:
-            from py_clob_client.clob_types import OpenOrderParams
-            
             async def _fetch():
                 # Fetch all open orders
-                open_orders = await asyncio.to_thread(self.client.get_orders, OpenOrderParams())
+                open_orders = await self._run_blocking(self.client.get_orders, OpenOrderParams())
                 
                 # Convert to list of dicts if needed
                 orders_list = []
-                if open_orders:
+                token_id_normalized = token_id.lower().strip()
+                if open_orders and token_id_normalized:
                     for order in open_orders:
                         # Convert order object to dict if needed
                         if not isinstance(order, dict):
@@ -529,24 +1303,19 @@ class PolymarketService:
                             else:
                                 # Try to extract common fields
                                 order = {
-                                    "id": getattr(order, "id", None) or getattr(order, "orderID", None),
-                                    "token_id": getattr(order, "token_id", None) or getattr(order, "tokenId", None),
+                                    "id": _extract_field(order, ORDER_ID_FIELDS),
+                                    "token_id": _extract_field(order, TOKEN_ID_FIELDS),
                                     "side": getattr(order, "side", None),
                                     "price": getattr(order, "price", None),
-                                    "size": getattr(order, "size", None) or getattr(order, "original_size", None),
+                                    "size": _extract_field(order, SIZE_FIELDS),
                                 }
                         
                         # Filter by token_id
-                        order_token_id = (
-                            order.get("token_id") or 
-                            order.get("tokenId") or 
-                            order.get("token")
-                        )
+                        order_token_id = _extract_field(order, TOKEN_ID_FIELDS)
                         
                         # Normalize token IDs for comparison (case-insensitive)
-                        if order_token_id and token_id:
-                            if order_token_id.lower().strip() == token_id.lower().strip():
-                                orders_list.append(order)
+                        if order_token_id and order_token_id.lower().strip() == token_id_normalized:
+                            orders_list.append(order)
                 
                 return orders_list
             
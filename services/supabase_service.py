@@ -8,51 +8,270 @@ This service handles all database operations including:
 It provides a clean interface for reading and writing data to Supabase.
 """
 
+import functools
 import logging
 import asyncio
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
 
 from config import TraderConfig
+from trading.utils.retry import retry_db_operation
 from trading.utils.slug_resolver import market_slug_resolver
 
 logger = logging.getLogger(__name__)
 
+# Pooled keep-alive connections for PostgREST requests; reads and writes use
+# separate pools so slow trader loads can't hold up fill/log writes
+WRITE_HTTP_LIMITS = httpx.Limits(max_connections=30, max_keepalive_connections=30, keepalive_expiry=60)
+READ_HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=60)
+HTTP_TIMEOUT = httpx.Timeout(connect=5, read=30, write=10, pool=30)
+HTTP_CONNECT_RETRIES = 3
+
+# Connection-level failures that are retried after resetting the HTTP pool
+TRANSIENT_HTTP_ERRORS = (
+    httpx.PoolTimeout,
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.RemoteProtocolError,
+)
+
+# Fills and logs are buffered and inserted in multi-row batches
+FLUSH_INTERVAL_SECONDS = 0.1
+FLUSH_MAX_ROWS = 100  # Rows per insert request
+
+# With a direct Postgres DSN, log batches are written with COPY over asyncpg
+LOG_COPY_COLUMNS = ("trader_id", "level", "message", "created_at")
+LOG_COPY_POOL_SIZE = 2
+
+# Trader columns read by load_all_traders/_row_to_config
+TRADER_COLUMNS = "id,market_slug,max_inventory,spread_threshold,price_improvement,status"
+
+# Writes ask PostgREST not to echo the written rows back (Prefer: return=minimal)
+RETURN_MINIMAL = "minimal"
+
+# TraderConfig fields written by _config_to_row, read in one call
+_get_trader_row_fields = attrgetter("market_slug", "max_inventory", "spread_threshold", "price_improvement")
+
+# Max concurrent market slug resolutions while loading traders
+SLUG_RESOLVE_CONCURRENCY = 20
+
+_timestamp_cache: Tuple[int, str] = (-1, "")  # (epoch second, formatted date/time)
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in ISO 8601 format (microsecond precision).
+    
+    The date/time part is formatted once per second; only the microsecond
+    suffix is formatted per call.
+    """
+    global _timestamp_cache
+    now = time.time()
+    second = int(now)
+    cached_second, cached_str = _timestamp_cache
+    if second != cached_second:
+        cached_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _timestamp_cache = (second, cached_str)
+    return f"{cached_str}.{int((now - second) * 1_000_000):06d}"
+
+
+def supabase_guard(default: Any, error_message: str, unavailable_message: Optional[str] = None):
+    """Decorate a SupabaseService coroutine with the availability check and error handling.
+    
+    The wrapped method returns default without running if the client is not
+    connected, and logs and returns default if it raises.
+    
+    Args:
+        default: Value returned when unavailable or on error
+        error_message: Logged (with the exception) when the method raises
+        unavailable_message: Optional warning logged when Supabase is unavailable
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if not self.client:
+                if unavailable_message:
+                    logger.warning(unavailable_message)
+                return default
+            try:
+                return await method(self, *args, **kwargs)
+            except Exception as e:
+                logger.error(f"{error_message}: {e}")
+                return default
+        return wrapper
+    return decorator
+
 
 class SupabaseService:
     """Service for managing trader data in Supabase."""
     
-    def __init__(self, supabase_url: str, supabase_key: str):
+    def __init__(self, supabase_url: str, supabase_key: str, db_url: str = "", read_url: str = ""):
         """Initialize Supabase service.
         
         Args:
             supabase_url: Supabase project URL
             supabase_key: Supabase anon/service key
+            db_url: Optional direct Postgres DSN (session pooler); when set and
+                asyncpg is installed, log rows are written with COPY
+            read_url: Optional read replica API URL for trader reads
+                (defaults to supabase_url)
         """
         self.url = supabase_url
         self.key = supabase_key
-        self.client = None
+        self.db_url = db_url
+        self.read_url = read_url or supabase_url
+        self.client = None  # AsyncClient for writes, created by connect()
+        self.read_client = None  # AsyncClient for reads, created by connect()
+        self._db_pool = None  # asyncpg pool for COPY log inserts, created by connect()
         self.table_name = "traders"
-        self._initialize_client()
+        self._pending_rows: Dict[str, List[Dict[str, Any]]] = {"fills": [], "logs": []}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._trader_id_cache: Dict[str, str] = {}  # market_slug -> trader UUID
+        self._trader_id_inflight: Dict[str, asyncio.Task] = {}  # market_slug -> pending lookup
+        self._resolve_semaphore = asyncio.Semaphore(SLUG_RESOLVE_CONCURRENCY)
+        self._slug_info_cache: Dict[str, Any] = {}  # market_slug -> resolved market info
+        self._realtime_channel = None  # traders change subscription, see subscribe_trader_changes()
     
-    def _initialize_client(self) -> None:
-        """Initialize Supabase client."""
+    async def connect(self) -> None:
+        """Create the async Supabase clients (one for writes, one for reads).
+        
+        Must be awaited once at startup before any other operation.
+        """
+        if self.client is not None:
+            return
         try:
-            from supabase import create_client, Client
-            self.client: Optional[Client] = create_client(self.url, self.key)
+            from supabase import acreate_client
+            self.client = await acreate_client(self.url, self.key)
+            await self._install_http_pool(self.client)
             logger.info("Supabase service initialized successfully")
         except ImportError:
             logger.warning("supabase-py not installed. SupabaseService will use mock mode.")
             self.client = None
+            return
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {e}")
             self.client = None
+            return
+        
+        try:
+            self.read_client = await acreate_client(self.read_url, self.key)
+            await self._install_http_pool(self.read_client)
+        except Exception as e:
+            logger.error(f"Failed to initialize Supabase read client, reads will use the write client: {e}")
+            self.read_client = self.client
+        
+        if self.db_url:
+            await self._connect_db_pool()
+    
+    async def _connect_db_pool(self) -> None:
+        """Open the direct Postgres pool used to COPY log rows.
+        
+        Falls back to PostgREST inserts if asyncpg is missing or the
+        connection fails.
+        """
+        try:
+            import asyncpg
+        except ImportError:
+            logger.warning("SUPABASE_DB_URL is set but asyncpg is not installed; logs use PostgREST inserts")
+            return
+        try:
+            self._db_pool = await asyncpg.create_pool(
+                self.db_url, min_size=1, max_size=LOG_COPY_POOL_SIZE
+            )
+            logger.info("Direct Postgres pool connected for log inserts")
+        except Exception as e:
+            logger.error(f"Failed to connect to Postgres for log inserts: {e}")
+            self._db_pool = None
+    
+    async def _install_http_pool(self, client) -> None:
+        """Swap a client's default PostgREST HTTP session for a pooled keep-alive client.
+        
+        Keeps the session's base URL and auth headers; only connection
+        limits, timeouts and connect retries change.
+        """
+        await self.reset_connection(client)
+    
+    async def reset_connection(self, client, stale_session: Optional[httpx.AsyncClient] = None) -> None:
+        """Replace a client's PostgREST HTTP session with a fresh pooled client.
+        
+        Args:
+            client: Supabase client (the write client or the read client)
+            stale_session: Session that failed; if it has already been
+                replaced (by a concurrent reset), nothing is done
+        """
+        postgrest = client.postgrest
+        old_session = postgrest.session
+        if stale_session is not None and old_session is not stale_session:
+            return
+        limits = WRITE_HTTP_LIMITS if client is self.client else READ_HTTP_LIMITS
+        postgrest.session = httpx.AsyncClient(
+            base_url=old_session.base_url,
+            headers=old_session.headers,
+            timeout=HTTP_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(limits=limits, retries=HTTP_CONNECT_RETRIES),
+        )
+        await old_session.aclose()
+    
+    async def _execute(self, build_query, read: bool = False):
+        """Execute a PostgREST query, retrying transient connection errors.
+        
+        On a TRANSIENT_HTTP_ERRORS failure the HTTP pool is reset and the
+        query is retried with jittered exponential backoff.
+        
+        Args:
+            build_query: Callable taking the client and returning a new query
+                builder; called once per attempt so retries are sent over
+                the reset session
+            read: Run the query on the read client instead of the write client
+            
+        Returns:
+            The PostgREST response
+        """
+        client = self.read_client if read else self.client
+        session = None
+        
+        async def attempt():
+            nonlocal session
+            session = client.postgrest.session
+            return await build_query(client).execute()
+        
+        async def reset(error):
+            await self.reset_connection(client, session)
+        
+        return await retry_db_operation(attempt, retry_on=TRANSIENT_HTTP_ERRORS, on_retry=reset)
+    
+    async def close(self) -> None:
+        """Flush buffered rows and close the Supabase HTTP connections."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self._flush_all()
+        if self._realtime_channel is not None:
+            try:
+                await self.client.remove_channel(self._realtime_channel)
+            except Exception as e:
+                logger.warning(f"Failed to unsubscribe from trader changes: {e}")
+            self._realtime_channel = None
+        if self._db_pool is not None:
+            await self._db_pool.close()
+            self._db_pool = None
+        if self.read_client is not None and self.read_client is not self.client:
+            await self.read_client.postgrest.session.aclose()
+        if self.client is not None:
+            await self.client.postgrest.session.aclose()
     
     def is_available(self) -> bool:
         """Check if Supabase is available.
         
         Returns:
-            True if Supabase client is initialized, False otherwise
+            True if Supabase client is initialized (see connect()), False otherwise
         """
         return self.client is not None
     
@@ -71,29 +290,56 @@ class SupabaseService:
         Returns:
             List of TraderConfig objects
         """
+        return [config for config, _ in await self.load_traders_with_status(include_paused)]
+    
+    async def load_traders_with_status(self, include_paused: bool = False) -> List[Tuple[TraderConfig, str]]:
+        """Load all traders from Supabase together with their status column.
+        
+        Same query as load_all_traders, so callers that need each trader's
+        status don't have to look it up per trader.
+        
+        Args:
+            include_paused: If True, includes paused traders. If False, only active traders.
+        
+        Returns:
+            List of (TraderConfig, status) tuples
+        """
         if not self.client:
             logger.warning("Supabase not available. Returning empty list.")
             return []
         
-        try:
-            query = self.client.table(self.table_name).select("*")
+        def build_query(client):
+            query = client.table(self.table_name).select(TRADER_COLUMNS)
             if not include_paused:
-                query = query.eq("status", "active")
-            else:
-                # Load active and paused, but not deleted
-                query = query.in_("status", ["active", "paused"])
+                return query.eq("status", "active")
+            # Load active and paused, but not deleted (filtered by PostgREST,
+            # so deleted rows never leave the database)
+            return query.in_("status", ["active", "paused"])
+        
+        try:
+            response = await self._execute(build_query, read=True)
             
-            response = query.execute()
+            # Rows already carry the ids; seed the lookup cache for free
+            self._trader_id_cache.update(
+                (row["market_slug"], row["id"])
+                for row in response.data
+                if row.get("market_slug") and row.get("id")
+            )
+            
+            # Resolve all market slugs concurrently (bounded in _row_to_config)
+            results = await asyncio.gather(
+                *(self._row_to_config(row) for row in response.data),
+                return_exceptions=True,
+            )
             
             traders = []
-            for row in response.data:
-                try:
-                    config = await self._row_to_config(row)
-                    if config:
-                        traders.append(config)
-                except (KeyError, ValueError) as e:
-                    logger.error(f"Failed to parse trader from DB: {e}, row: {row}")
-                    continue
+            for row, result in zip(response.data, results):
+                if isinstance(result, (KeyError, ValueError)):
+                    logger.error(f"Failed to parse trader from DB: {result}, row: {row}")
+                elif isinstance(result, BaseException):
+                    raise result
+                elif result:
+                    traders.append((result, row.get("status", "active")))
             
             logger.info(f"Loaded {len(traders)} traders from Supabase")
             return traders
@@ -102,7 +348,7 @@ class SupabaseService:
             logger.error(f"Failed to load traders from Supabase: {e}")
             return []
     
-    def load_trader_by_slug(self, market_slug: str, include_paused: bool = False) -> Optional[TraderConfig]:
+    async def load_trader_by_slug(self, market_slug: str, include_paused: bool = False) -> Optional[TraderConfig]:
         """Load a single trader by market slug.
         
         Args:
@@ -115,10 +361,10 @@ class SupabaseService:
         if not self.client:
             return None
         
-        try:
+        def build_query(client):
             query = (
-                self.client.table(self.table_name)
-                .select("*")
+                client.table(self.table_name)
+                .select(TRADER_COLUMNS)
                 .eq("market_slug", market_slug)
             )
             
@@ -127,18 +373,62 @@ class SupabaseService:
             else:
                 # Load active and paused, but not deleted
                 query = query.in_("status", ["active", "paused"])
+            return query.maybe_single()
+        
+        try:
+            response = await self._execute(build_query, read=True)
             
-            response = query.limit(1).execute()
+            # maybe_single() yields one row object, or no response if nothing matched
+            if response is not None and response.data:
+                return await self._row_to_config(response.data)
+            return None
             
-            if response.data:
-                return self._row_to_config(response.data[0])
+        except Exception as e:
+            logger.error(f"Failed to load trader {market_slug} from Supabase: {e}")
             return None
+    
+    async def load_trader_full(
+        self, market_slug: str
+    ) -> Optional[Tuple[str, Optional[str], Optional[TraderConfig]]]:
+        """Load a trader's status, id and config in a single request.
+        
+        Use instead of calling get_trader_status, get_trader_id_by_slug and
+        load_trader_by_slug for the same slug.
+        
+        Args:
+            market_slug: Market slug to load
+            
+        Returns:
+            Tuple of (status, trader_id, config), or None if not found.
+            config is None for deleted traders or if market resolution fails.
+        """
+        if not self.client:
+            return None
+        
+        try:
+            response = await self._execute(
+                lambda client: client.table(self.table_name)
+                .select(TRADER_COLUMNS)
+                .eq("market_slug", market_slug)
+                .maybe_single(),
+                read=True,
+            )
+            
+            if response is None or not response.data:
+                return None
+            row = response.data
+            trader_id = row.get("id")
+            if trader_id:
+                self._trader_id_cache[market_slug] = trader_id
+            status = row.get("status", "active")
+            config = None if status == "deleted" else await self._row_to_config(row)
+            return status, trader_id, config
             
         except Exception as e:
             logger.error(f"Failed to load trader {market_slug} from Supabase: {e}")
             return None
     
-    def get_trader_status(self, market_slug: str) -> Optional[str]:
+    async def get_trader_status(self, market_slug: str) -> Optional[str]:
         """Get trader status from Supabase.
         
         Args:
@@ -151,16 +441,16 @@ class SupabaseService:
             return None
         
         try:
-            response = (
-                self.client.table(self.table_name)
+            response = await self._execute(
+                lambda client: client.table(self.table_name)
                 .select("status")
                 .eq("market_slug", market_slug)
-                .limit(1)
-                .execute()
+                .maybe_single(),
+                read=True,
             )
             
-            if response.data:
-                return response.data[0].get("status", "active")
+            if response is not None and response.data:
+                return response.data.get("status", "active")
             return None
             
         except Exception as e:
@@ -171,10 +461,13 @@ class SupabaseService:
     # Write Operations
     # ============================================================================
     
-    def save_trader(self, config: TraderConfig) -> bool:
+    @supabase_guard(False, "Failed to save trader to Supabase", "Supabase not available. Skipping save.")
+    async def save_trader(self, config: TraderConfig) -> bool:
         """Save a trader configuration to Supabase (upsert).
         
-        Uses market_slug as the identifier. Saves market_slug, min_gap, budget, price_improvement, and status.
+        Uses market_slug as the identifier (requires a unique constraint on
+        traders.market_slug). Saves market_slug, max_inventory,
+        spread_threshold, price_improvement, and status.
         
         Args:
             config: TraderConfig to save
@@ -182,44 +475,25 @@ class SupabaseService:
         Returns:
             True if successful, False otherwise
         """
-        if not self.client:
-            logger.warning("Supabase not available. Skipping save.")
-            return False
-        
         if not config.market_slug:
             logger.error("Cannot save trader: market_slug is required")
             return False
         
-        try:
-            data = self._config_to_row(config)
-            
-            # Check if trader exists by market_slug
-            existing = (
-                self.client.table(self.table_name)
-                .select("id")
-                .eq("market_slug", config.market_slug)
-                .execute()
-            )
-            
-            if existing.data:
-                # Update existing
-                self.client.table(self.table_name).update(data).eq(
-                    "market_slug", config.market_slug
-                ).execute()
-                logger.debug(f"Updated trader {config.market_slug} in Supabase")
-            else:
-                # Insert new
-                data["created_at"] = datetime.utcnow().isoformat()
-                self.client.table(self.table_name).insert(data).execute()
-                logger.debug(f"Saved trader {config.market_slug} to Supabase")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to save trader to Supabase: {e}")
-            return False
+        data = self._config_to_row(config)
+        
+        # Single-request insert-or-update keyed on the unique market_slug;
+        # created_at is left to the column default so updates keep it
+        await self._execute(
+            lambda client: client.table(self.table_name)
+            .upsert(data, on_conflict="market_slug", returning=RETURN_MINIMAL)
+        )
+        logger.debug(f"Saved trader {config.market_slug} to Supabase")
+        self._trader_id_cache.pop(config.market_slug, None)
+        
+        return True
     
-    def delete_trader(self, market_slug: str) -> bool:
+    @supabase_guard(False, "Failed to delete trader from Supabase", "Supabase not available. Skipping delete.")
+    async def delete_trader(self, market_slug: str) -> bool:
         """Delete (soft delete) a trader from Supabase by setting status to 'deleted'.
         
         Args:
@@ -228,24 +502,19 @@ class SupabaseService:
         Returns:
             True if successful, False otherwise
         """
-        if not self.client:
-            logger.warning("Supabase not available. Skipping delete.")
-            return False
+        # updated_at is stamped by the traders table trigger
+        await self._execute(
+            lambda client: client.table(self.table_name)
+            .update({"status": "deleted"}, returning=RETURN_MINIMAL)
+            .eq("market_slug", market_slug)
+        )
         
-        try:
-            self.client.table(self.table_name).update({
-                "status": "deleted",
-                "updated_at": datetime.utcnow().isoformat(),
-            }).eq("market_slug", market_slug).execute()
-            
-            logger.info(f"Deleted trader {market_slug} from Supabase")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to delete trader from Supabase: {e}")
-            return False
+        logger.info(f"Deleted trader {market_slug} from Supabase")
+        self._trader_id_cache.pop(market_slug, None)
+        return True
     
-    def update_trader_status(self, market_slug: str, status: str) -> bool:
+    @supabase_guard(False, "Failed to update trader status in Supabase")
+    async def update_trader_status(self, market_slug: str, status: str) -> bool:
         """Update status of a trader.
         
         Args:
@@ -255,29 +524,23 @@ class SupabaseService:
         Returns:
             True if successful, False otherwise
         """
-        if not self.client:
-            return False
-        
         if status not in ['active', 'paused', 'deleted']:
             logger.error(f"Invalid status: {status}. Must be 'active', 'paused', or 'deleted'")
             return False
         
-        try:
-            self.client.table(self.table_name).update({
-                "status": status,
-                "updated_at": datetime.utcnow().isoformat(),
-            }).eq("market_slug", market_slug).execute()
-            
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update trader status in Supabase: {e}")
-            return False
+        await self._execute(
+            lambda client: client.table(self.table_name)
+            .update({"status": status}, returning=RETURN_MINIMAL)
+            .eq("market_slug", market_slug)
+        )
+        return True
     
     # ============================================================================
     # Fills Operations
     # ============================================================================
     
-    def save_fill(
+    @supabase_guard(False, "Failed to save fill to Supabase", "Supabase not available. Skipping fill save.")
+    async def save_fill(
         self,
         trader_id: Optional[str],
         market_slug: str,
@@ -289,8 +552,12 @@ class SupabaseService:
     ) -> bool:
         """Save a fill (executed trade) to Supabase.
         
+        The row is buffered and inserted with other fills in one batch within
+        FLUSH_INTERVAL_SECONDS; insert errors are logged, not returned.
+        
         Args:
-            trader_id: UUID of the trader (from traders table), or None if not available
+            trader_id: UUID of the trader (from traders table), or None to take
+                it from the trader id cache without a lookup query
             market_slug: Market slug
             side: 'buy' or 'sell'
             price: Execution price
@@ -299,39 +566,37 @@ class SupabaseService:
             pnl: Optional realized profit/loss for this fill
             
         Returns:
-            True if successful, False otherwise
+            True if the fill was queued, False otherwise
         """
-        if not self.client:
-            logger.warning("Supabase not available. Skipping fill save.")
-            return False
-        
         if side.upper() not in ['BUY', 'SELL']:
             logger.error(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
             return False
         
-        try:
-            data = {
-                "trader_id": trader_id,
-                "market_slug": market_slug,
-                "side": side.lower(),  # Store as 'buy' or 'sell' per schema
-                "price": float(price),
-                "size": float(size),
-                "order_id": order_id,
-                "pnl": float(pnl) if pnl is not None else None,
-                "created_at": datetime.utcnow().isoformat(),
-            }
-            
-            self.client.table("fills").insert(data).execute()
-            logger.debug(f"Saved fill to Supabase: {side} {size:.2f} @ {price:.4f} for {market_slug}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to save fill to Supabase: {e}")
-            return False
+        if trader_id is None:
+            trader_id = self._trader_id_cache.get(market_slug)
+        
+        data = {
+            "trader_id": trader_id,
+            "market_slug": market_slug,
+            "side": side.lower(),  # Store as 'buy' or 'sell' per schema
+            "price": float(price),
+            "size": float(size),
+            "order_id": order_id,
+            "pnl": float(pnl) if pnl is not None else None,
+            "created_at": _utc_timestamp(),
+        }
+        
+        self._buffer_row("fills", data)
+        logger.debug(f"Queued fill for Supabase: {side} {size:.2f} @ {price:.4f} for {market_slug}")
+        return True
     
-    def get_trader_id_by_slug(self, market_slug: str) -> Optional[str]:
+    async def get_trader_id_by_slug(self, market_slug: str) -> Optional[str]:
         """Get trader UUID (id) by market_slug.
         
+        Ids are cached per slug for the session (seeded by load_all_traders)
+        and dropped when the trader is saved or deleted. Concurrent lookups
+        of an uncached slug share one query.
+        
         Args:
             market_slug: Market slug to look up
             
@@ -341,17 +606,34 @@ class SupabaseService:
         if not self.client:
             return None
         
+        trader_id = self._trader_id_cache.get(market_slug)
+        if trader_id is not None:
+            return trader_id
+        
+        task = self._trader_id_inflight.get(market_slug)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_trader_id(market_slug))
+            self._trader_id_inflight[market_slug] = task
+            task.add_done_callback(lambda _: self._trader_id_inflight.pop(market_slug, None))
+        # Shield so one cancelled caller doesn't cancel the shared lookup
+        return await asyncio.shield(task)
+    
+    async def _fetch_trader_id(self, market_slug: str) -> Optional[str]:
+        """Query the trader UUID for market_slug and cache it if found."""
         try:
-            response = (
-                self.client.table(self.table_name)
+            response = await self._execute(
+                lambda client: client.table(self.table_name)
                 .select("id")
                 .eq("market_slug", market_slug)
-                .limit(1)
-                .execute()
+                .maybe_single(),
+                read=True,
             )
             
-            if response.data:
-                return response.data[0].get("id")
+            if response is not None and response.data:
+                trader_id = response.data.get("id")
+                if trader_id:
+                    self._trader_id_cache[market_slug] = trader_id
+                return trader_id
             return None
             
         except Exception as e:
@@ -362,7 +644,7 @@ class SupabaseService:
     # Logs Operations
     # ============================================================================
     
-    def save_log(
+    async def save_log(
         self,
         trader_id: Optional[str],
         level: str,
@@ -370,13 +652,16 @@ class SupabaseService:
     ) -> bool:
         """Save a log entry to Supabase.
         
+        The row is buffered and inserted with other log entries in one batch
+        within FLUSH_INTERVAL_SECONDS.
+        
         Args:
             trader_id: UUID of the trader (from traders table), or None if not available
             level: Log level ('info', 'warning', 'error', 'debug')
             message: Log message
             
         Returns:
-            True if successful, False otherwise
+            True if the entry was queued, False otherwise
         """
         if not self.client:
             # Don't log warning for logs - it would create infinite loop
@@ -391,10 +676,11 @@ class SupabaseService:
                 "trader_id": trader_id,
                 "level": level.lower(),
                 "message": str(message),
-                "created_at": datetime.utcnow().isoformat(),
+                # Kept as a datetime for COPY; formatted only for PostgREST inserts
+                "created_at": datetime.now(timezone.utc),
             }
             
-            self.client.table("logs").insert(data).execute()
+            self._buffer_row("logs", data)
             return True
             
         except Exception as e:
@@ -402,6 +688,119 @@ class SupabaseService:
             # Just silently fail
             return False
     
+    # ============================================================================
+    # Realtime
+    # ============================================================================
+    
+    async def subscribe_trader_changes(
+        self,
+        callback: Callable[[str, Dict[str, Any], Dict[str, Any]], None],
+        on_status: Optional[Callable[[bool], None]] = None,
+    ) -> bool:
+        """Subscribe to inserts, updates and deletes on the traders table.
+        
+        Uses Supabase Realtime (the traders table must be in the
+        supabase_realtime publication).
+        
+        Args:
+            callback: Called on the event loop as callback(event, new_row, old_row),
+                with event one of 'INSERT', 'UPDATE', 'DELETE'
+            on_status: Called as on_status(True) once the channel is subscribed
+                and on_status(False) if it errors, times out or closes
+            
+        Returns:
+            True if subscribed, False if Realtime is unavailable
+        """
+        if not self.client:
+            return False
+        
+        def on_change(payload: Dict[str, Any]) -> None:
+            # realtime-py has shipped two payload layouts; accept both
+            data = payload.get("data", payload)
+            event = data.get("type") or data.get("eventType") or ""
+            new_row = data.get("record") or data.get("new") or {}
+            old_row = data.get("old_record") or data.get("old") or {}
+            callback(str(event).upper(), new_row, old_row)
+        
+        def on_subscribe(state: Any, error: Optional[Exception] = None) -> None:
+            # RealtimeSubscribeStates: SUBSCRIBED, CHANNEL_ERROR, TIMED_OUT, CLOSED
+            state_name = str(getattr(state, "value", state)).upper()
+            if state_name == "SUBSCRIBED":
+                if on_status is not None:
+                    on_status(True)
+                return
+            logger.warning(f"Supabase Realtime channel {state_name}: {error}")
+            if on_status is not None:
+                on_status(False)
+        
+        try:
+            channel = self.client.channel(f"{self.table_name}-changes")
+            channel.on_postgres_changes("*", on_change, table=self.table_name, schema="public")
+            await channel.subscribe(on_subscribe)
+        except Exception as e:
+            logger.warning(f"Supabase Realtime unavailable, trader changes will be polled: {e}")
+            return False
+        
+        self._realtime_channel = channel
+        logger.info(f"Subscribed to {self.table_name} changes via Supabase Realtime")
+        return True
+    
+    # ============================================================================
+    # Batched Inserts
+    # ============================================================================
+    
+    def _buffer_row(self, table: str, row: Dict[str, Any]) -> None:
+        """Queue a row for the next batched insert into table."""
+        self._pending_rows[table].append(row)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self) -> None:
+        """Insert buffered rows every FLUSH_INTERVAL_SECONDS."""
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            await self._flush_all()
+    
+    async def _flush_all(self) -> None:
+        for table in self._pending_rows:
+            await self._flush_table(table)
+    
+    async def _flush_table(self, table: str) -> None:
+        """Insert all buffered rows of a table, FLUSH_MAX_ROWS per request."""
+        rows = self._pending_rows[table]
+        if not rows or not self.client:
+            return
+        self._pending_rows[table] = []
+        if table == "logs":
+            if self._db_pool is not None and await self._copy_logs(rows):
+                return
+            rows = [{**row, "created_at": row["created_at"].isoformat()} for row in rows]
+        for start in range(0, len(rows), FLUSH_MAX_ROWS):
+            batch = rows[start:start + FLUSH_MAX_ROWS]
+            try:
+                await self._execute(lambda client: client.table(table).insert(batch, returning=RETURN_MINIMAL))
+                if table == "fills":
+                    logger.debug(f"Saved {len(batch)} fills to Supabase")
+            except Exception as e:
+                if table == "fills":
+                    logger.error(f"Failed to save {len(batch)} fills to Supabase: {e}")
+                # Don't log failed logs inserts - it would create infinite loop
+    
+    async def _copy_logs(self, rows: List[Dict[str, Any]]) -> bool:
+        """Write log rows with a single COPY over the direct Postgres pool.
+        
+        Returns:
+            True if the rows were written, False to fall back to PostgREST
+        """
+        records = [(row["trader_id"], row["level"], row["message"], row["created_at"]) for row in rows]
+        try:
+            async with self._db_pool.acquire() as conn:
+                await conn.copy_records_to_table("logs", records=records, columns=LOG_COPY_COLUMNS)
+            return True
+        except Exception:
+            # Don't log failed logs inserts - it would create infinite loop
+            return False
+    
     # ============================================================================
     # Helper Methods
     # ============================================================================
@@ -410,6 +809,7 @@ class SupabaseService:
         """Convert TraderConfig to database row.
         
         Saves fields: market_slug, min_gap, budget, price_improvement, status.
+        updated_at is left to the traders table trigger.
         
         Args:
             config: TraderConfig to convert
@@ -417,22 +817,23 @@ class SupabaseService:
         Returns:
             Dictionary representing database row
         """
+        market_slug, max_inventory, spread_threshold, price_improvement = _get_trader_row_fields(config)
         # Determine status from is_paused (if TraderConfig has it) or default to 'active'
         status = "paused" if getattr(config, 'is_paused', False) else "active"
         
         return {
-            "market_slug": config.market_slug or "",
-            "max_inventory": config.max_inventory,
-            "spread_threshold": config.spread_threshold,
-            "price_improvement": config.price_improvement,
+            "market_slug": market_slug or "",
+            "max_inventory": max_inventory,
+            "spread_threshold": spread_threshold,
+            "price_improvement": price_improvement,
             "status": status,
-            "updated_at": datetime.utcnow().isoformat(),
         }
     
     async def _row_to_config(self, row: Dict[str, Any]) -> Optional[TraderConfig]:
         """Convert database row to TraderConfig.
         
         Resolves market_slug to market_id and token_id using the market resolver.
+        Resolutions are cached for the lifetime of the service.
         
         Args:
             row: Database row dictionary
@@ -445,16 +846,20 @@ class SupabaseService:
             logger.error("Cannot load trader: market_slug is missing")
             return None
         
-        # Resolve market_slug to market_id and token_id
-        try:
-            market_info = await market_slug_resolver(market_slug)
-        except Exception as e:
-            logger.error(f"Failed to resolve market_slug '{market_slug}': {e}")
-            return None
-        
-        if not market_info:
-            logger.error(f"Failed to resolve market_slug '{market_slug}' to market_id/token_id")
-            return None
+        # Resolve market_slug to market_id and token_id (successful lookups are cached)
+        market_info = self._slug_info_cache.get(market_slug)
+        if market_info is None:
+            try:
+                async with self._resolve_semaphore:
+                    market_info = await market_slug_resolver(market_slug)
+            except Exception as e:
+                logger.error(f"Failed to resolve market_slug '{market_slug}': {e}")
+                return None
+            
+            if not market_info:
+                logger.error(f"Failed to resolve market_slug '{market_slug}' to market_id/token_id")
+                return None
+            self._slug_info_cache[market_slug] = market_info
         
         # Extract market_id and token_id from resolved info
         if isinstance(market_info, dict):
@@ -473,15 +878,13 @@ class SupabaseService:
         status = row.get("status", "active")
         is_paused = (status == "paused")
         
-        return TraderConfig(
-            market_id=market_id,
-            token_id=token_id,
-            market_slug=market_slug,
-            name=market_slug,  # Use market_slug as name if not provided
-            budget=float(row["budget"]),
-            min_gap=float(row["min_gap"]),
+        return TraderConfig.from_row({
+            "market_id": market_id,
+            "token_id": token_id,
+            "market_slug": market_slug,
+            "name": market_slug,  # Use market_slug as name if not provided
+            "max_inventory": float(row["max_inventory"]),
+            "spread_threshold": float(row["spread_threshold"]),
             # Load price_improvement from database, default to 1.0 cent if not present
-            price_improvement=float(row.get("price_improvement", 1.0)),
-            max_retries=3,
-            retry_delay_seconds=1.0,
-        )
+            "price_improvement": float(row.get("price_improvement", 1.0)),
+        })
@@ -1,11 +1,11 @@
 """Core trading components."""
 
-from .trader import Trader, TraderState
+from .trader import Trader, MarketState
 from .manager import TraderManager
 
 __all__ = [
     "Trader",
-    "TraderState",
+    "MarketState",
     "TraderManager",
 ]
 
@@ -1,10 +1,13 @@
 """Trader manager for coordinating multiple trader agents."""
 
 import asyncio
+import functools
+import io
 import logging
+import random
+import sys
 import time
-from typing import Dict, Optional, Any
-from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Sequence, Set
 
 from .trader import Trader
 from services import PolymarketService
@@ -13,6 +16,25 @@ from config import TraderConfig, ManagerConfig
 
 logger = logging.getLogger(__name__)
 
+# Run loop sleep: never below this floor, randomized by +/- POLL_JITTER
+MIN_POLL_INTERVAL_SECONDS = 0.05
+POLL_JITTER = 0.1
+
+# Invariant rules of the status report
+_SEP80 = "=" * 80
+_DASH80 = "-" * 80
+_STATUS_HEADER_RULE = "\n" + _SEP80
+STATUS_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# While Realtime pushes trader changes, the full Supabase sync only
+# reconciles missed events, every this many sync intervals
+REALTIME_RECONCILE_INTERVALS = 10
+
+
+def _fmt(value: Optional[float], spec: str, na: str = "N/A") -> str:
+    """Format an optional number with the given format spec, or na if it is None."""
+    return na if value is None else format(value, spec)
+
 
 class TraderManager:
     """Manages multiple trader agents and monitors global risk."""
@@ -38,22 +60,29 @@ class TraderManager:
         self.last_status_update: float = 0.0
         self.last_supabase_sync: float = 0.0
         self.supabase_service = supabase_service
+        self._realtime_sync = False  # True while Supabase Realtime pushes trader changes
+        self._sync_wakeup = asyncio.Event()  # Set to run the Supabase sync immediately
+        self._change_tasks: Set[asyncio.Task] = set()
+        # Running (active, unpaused) and paused traders plus the running
+        # traders' step() methods; see _refresh_trader_lists()
+        self._running: List[Trader] = []
+        self._paused: List[Trader] = []
+        self._step_fns: List[Callable[[], Awaitable[None]]] = []
+        self._step_semaphore = asyncio.Semaphore(config.max_concurrent_steps)
+        self._stop_event = asyncio.Event()  # Set by stop() to end run()
+        # print() the status report only when someone is watching stdout
+        self._status_to_console = config.console_status or sys.stdout.isatty()
         
         logger.info("TraderManager initialized")
     
-    def _sync_to_supabase(self, operation) -> None:
-        """Helper to sync operations to Supabase without blocking.
-        
-        Args:
-            operation: Callable that performs the Supabase operation
-        """
-        try:
-            # Run in background thread to avoid blocking
-            import threading
-            thread = threading.Thread(target=operation, daemon=True)
-            thread.start()
-        except Exception as e:
-            logger.warning(f"Failed to sync to Supabase (non-critical): {e}")
+    def _create_trader(self, config: TraderConfig) -> Trader:
+        """Create a Trader instance wired to this manager's services."""
+        return Trader(
+            market_id=config.market_id,
+            config=config,
+            execution_layer=self.execution,
+            supabase_service=self.supabase_service,
+        )
     
     def add_trader(self, config: TraderConfig) -> Trader:
         """Add a trader to the manager.
@@ -72,18 +101,43 @@ class TraderManager:
             return self.traders[config.market_id]
         
         # Create trader instance
-        trader = Trader(
-            market_id=config.market_id,
-            config=config,
-            execution_layer=self.execution,
-            supabase_service=self.supabase_service,
-        )
+        trader = self._create_trader(config)
         
         self.traders[config.market_id] = trader
+        self._refresh_trader_lists()
         logger.info(f"Added trader for market {config.market_id} (slug: {config.market_slug})")
         
         return trader
     
+    def add_traders(self, configs: Sequence[TraderConfig]) -> List[Trader]:
+        """Add several traders in one batch.
+        
+        Builds all new Trader instances first, then merges them into
+        self.traders with a single update and logs one summary line.
+        
+        Args:
+            configs: Trader configurations to add
+            
+        Returns:
+            Trader instances for the given configs (existing traders are reused)
+        """
+        new_traders: Dict[str, Trader] = {}
+        for config in configs:
+            if config.market_id in self.traders or config.market_id in new_traders:
+                logger.debug(f"Trader for market {config.market_id} already exists")
+                continue
+            new_traders[config.market_id] = self._create_trader(config)
+        
+        self.traders.update(new_traders)
+        if new_traders:
+            self._refresh_trader_lists()
+            logger.info(
+                f"Added {len(new_traders)} traders: "
+                f"{', '.join(config.market_slug or config.market_id for config in configs if config.market_id in new_traders)}"
+            )
+        
+        return [self.traders[config.market_id] for config in configs]
+    
     def remove_trader(self, market_id: str) -> bool:
         """Remove a trader from the manager.
         
@@ -102,10 +156,45 @@ class TraderManager:
         trader = self.traders[market_id]
         trader.stop()
         del self.traders[market_id]
+        self._refresh_trader_lists()
         logger.info(f"Removed trader for market {market_id}")
         
         return True
     
+    def _refresh_trader_lists(self) -> None:
+        """Re-bucket traders into running/paused and refresh the step() callables.
+        
+        Must be called after traders are added, removed, paused or resumed.
+        """
+        self._running = [t for t in self.traders.values() if t.is_active and not t.is_paused]
+        self._paused = [t for t in self.traders.values() if t.is_paused]
+        self._step_fns = [trader.step for trader in self._running]
+    
+    async def _guarded_step(self, step: Callable[[], Awaitable[None]]) -> None:
+        """Run one trader step under the concurrency limit, logging instead of raising."""
+        async with self._step_semaphore:
+            try:
+                await step()
+            except Exception as e:
+                logger.error(f"Trader step failed: {e}")
+    
+    def replace_traders(self, configs: List[TraderConfig]) -> None:
+        """Make the running trader set match the given configs.
+        
+        Adds traders that are missing locally and removes traders that are
+        not in the list. Existing traders are kept as-is.
+        
+        Args:
+            configs: Full list of trader configurations that should be running
+        """
+        new_market_ids = {config.market_id for config in configs}
+        
+        for market_id in list(self.traders.keys()):
+            if market_id not in new_market_ids:
+                self.remove_trader(market_id)
+        
+        self.add_traders(configs)
+    
     async def _sync_traders_from_supabase(self) -> None:
         """Sync traders from Supabase to detect changes made by frontend.
         
@@ -118,65 +207,104 @@ class TraderManager:
             return
         
         try:
-            # Load all traders (active and paused, but not deleted) from Supabase
-            db_traders = await self.supabase_service.load_all_traders(include_paused=True)
+            # Load all traders (active and paused, but not deleted) with their
+            # status in one query
+            db_traders = await self.supabase_service.load_traders_with_status(include_paused=True)
             
-            # Create a map of market_id -> config for quick lookup
-            db_traders_map = {config.market_id: config for config in db_traders}
+            # Create a map of market_id -> (config, status) for quick lookup
+            db_traders_map = {config.market_id: (config, status) for config, status in db_traders}
             db_market_ids = set(db_traders_map.keys())
             local_market_ids = set(self.traders.keys())
             
             # 1. Add new traders (in DB but not locally)
-            for config in db_traders:
+            for config, _ in db_traders:
                 if config.market_id not in local_market_ids:
                     logger.info(f"Detected new trader from Supabase: {config.market_slug} (market_id: {config.market_id[:20]}...)")
                     self.add_trader(config)
             
-            # 2. Remove deleted traders (in local but not in DB, or status='deleted')
-            traders_to_remove = []
-            for market_id, trader in self.traders.items():
-                if market_id not in db_market_ids:
-                    # Trader exists locally but not in DB - mark for removal
-                    traders_to_remove.append(market_id)
-                else:
-                    # Check if status is 'deleted' by querying directly
-                    status = self._get_trader_status_from_db(trader.config.market_slug or "")
-                    if status == "deleted":
-                        traders_to_remove.append(market_id)
+            # 2. Remove deleted traders (deleted rows are not loaded, so
+            # status='deleted' traders are missing from the DB map too)
+            traders_to_remove = local_market_ids - db_market_ids
             
             for market_id in traders_to_remove:
                 logger.info(f"Detected deleted trader from Supabase: {market_id[:20]}... - removing")
                 self.remove_trader(market_id)
             
             # 3. Update pause/resume status for existing traders
-            for market_id, trader in self.traders.items():
-                if market_id in db_traders_map:
-                    config = db_traders_map[market_id]
-                    status = self._get_trader_status_from_db(config.market_slug or "")
-                    
-                    if status == "paused" and not trader.is_paused:
-                        logger.info(f"Trader {config.market_slug} was paused in Supabase - pausing locally")
-                        trader.pause()
-                    elif status == "active" and trader.is_paused:
-                        logger.info(f"Trader {config.market_slug} was resumed in Supabase - resuming locally")
-                        trader.resume()
+            for market_id in self.traders.keys() & db_market_ids:
+                trader = self.traders[market_id]
+                config, status = db_traders_map[market_id]
+                
+                if status == "paused" and not trader.is_paused:
+                    logger.info(f"Trader {config.market_slug} was paused in Supabase - pausing locally")
+                    trader.pause()
+                elif status == "active" and trader.is_paused:
+                    logger.info(f"Trader {config.market_slug} was resumed in Supabase - resuming locally")
+                    trader.resume()
+            self._refresh_trader_lists()
         
         except Exception as e:
             logger.error(f"Failed to sync traders from Supabase: {e}")
     
-    def _get_trader_status_from_db(self, market_slug: str) -> Optional[str]:
-        """Get trader status from Supabase.
+    def _on_realtime_status(self, subscribed: bool) -> None:
+        """Track the Realtime channel; on failure fall back to polling right away."""
+        self._realtime_sync = subscribed
+        if not subscribed:
+            # Changes may have been missed while the channel was failing
+            self._sync_wakeup.set()
+    
+    def _on_trader_change(self, event: str, new_row: Dict[str, Any], old_row: Dict[str, Any]) -> None:
+        """Handle a Supabase Realtime change on the traders table.
+        
+        Schedules _apply_trader_change so the Realtime callback returns immediately.
+        """
+        task = asyncio.create_task(self._apply_trader_change(event, new_row, old_row))
+        self._change_tasks.add(task)
+        task.add_done_callback(self._change_tasks.discard)
+    
+    async def _apply_trader_change(self, event: str, new_row: Dict[str, Any], old_row: Dict[str, Any]) -> None:
+        """Apply one traders table change (add, remove, pause or resume a trader).
         
         Args:
-            market_slug: Market slug to check
-            
-        Returns:
-            Status string ('active', 'paused', 'deleted') or None if not found
+            event: 'INSERT', 'UPDATE' or 'DELETE'
+            new_row: Row after the change (empty for deletes)
+            old_row: Row before the change (may only contain the primary key)
         """
-        if not self.supabase_service or not self.supabase_service.is_available():
-            return None
+        try:
+            market_slug = new_row.get("market_slug") or old_row.get("market_slug")
+            if not market_slug:
+                # Delete without the full old row: fall back to a full sync
+                await self._sync_traders_from_supabase()
+                return
+            
+            trader = next(
+                (t for t in self.traders.values() if t.config.market_slug == market_slug), None
+            )
+            status = "deleted" if event == "DELETE" else new_row.get("status", "active")
+            
+            if status == "deleted":
+                if trader is not None:
+                    logger.info(f"Trader {market_slug} was deleted in Supabase - removing")
+                    self.remove_trader(trader.market_id)
+                return
+            
+            if trader is None:
+                result = await self.supabase_service.load_trader_full(market_slug)
+                if result is None or result[2] is None:
+                    return
+                logger.info(f"Detected new trader from Supabase: {market_slug}")
+                trader = self.add_trader(result[2])
+            
+            if status == "paused" and not trader.is_paused:
+                logger.info(f"Trader {market_slug} was paused in Supabase - pausing locally")
+                trader.pause()
+            elif status == "active" and trader.is_paused:
+                logger.info(f"Trader {market_slug} was resumed in Supabase - resuming locally")
+                trader.resume()
+            self._refresh_trader_lists()
         
-        return self.supabase_service.get_trader_status(market_slug)
+        except Exception as e:
+            logger.error(f"Failed to apply trader change from Supabase: {e}")
     
     def pause_trader(self, market_id: str) -> bool:
         """Pause a specific trader.
@@ -188,6 +316,7 @@ class TraderManager:
         
         trader = self.traders[market_id]
         trader.pause()
+        self._refresh_trader_lists()
         
         return True
     
@@ -201,6 +330,7 @@ class TraderManager:
         
         trader = self.traders[market_id]
         trader.resume()
+        self._refresh_trader_lists()
         
         return True
     
@@ -208,12 +338,14 @@ class TraderManager:
         """Pause all traders."""
         for trader in self.traders.values():
             trader.pause()
+        self._refresh_trader_lists()
         logger.info("All traders paused")
     
     def resume_all(self) -> None:
         """Resume all traders."""
         for trader in self.traders.values():
             trader.resume()
+        self._refresh_trader_lists()
         logger.info("All traders resumed")
     
     async def _monitor_risk(self) -> bool:
@@ -223,11 +355,9 @@ class TraderManager:
         Each trader manages its own budget independently.
         """
         try:
-            total_pnl = 0.0
-            
-            for trader in self.traders.values():
-                status = await trader.get_status()
-                total_pnl += status.get("total_pnl", 0.0)
+            # Read the P&L counters directly; get_status() would refetch each
+            # trader's orderbook, position and orders from Polymarket
+            total_pnl = sum(trader.total_pnl for trader in self.traders.values())
             
             # Check P&L loss limit - shutdown only for severe losses
             if total_pnl < self.config.max_total_pnl_loss:
@@ -246,33 +376,69 @@ class TraderManager:
     
     async def _print_status(self) -> None:
         """Print status update for all traders."""
-        current_time = time.time()
+        current_time = time.monotonic()
+        self.last_status_update = current_time
         
-        if current_time - self.last_status_update < self.config.status_update_interval_seconds:
+        to_console = self._status_to_console
+        to_log = logger.isEnabledFor(logging.INFO)
+        if not (to_console or to_log):
             return
         
-        self.last_status_update = current_time
+        # Fetch all trader statuses concurrently; count on the loop thread
+        # since traders may be added/removed while the report is formatted
+        statuses = await asyncio.gather(*(trader.get_status() for trader in self.traders.values()))
+        # Count only non-paused traders
+        active_count = len(self._running)
+        paused_count = len(self._paused)
+        
+        # Format in a worker thread so trader steps aren't blocked
+        status_text = await asyncio.to_thread(
+            self._build_status_text, statuses, current_time, active_count, paused_count
+        )
+        
+        # Print to an interactive console and log to file
+        if to_console:
+            print(status_text)
+        if to_log:
+            logger.info("\n%s", status_text)
+    
+    def _build_status_text(
+        self,
+        statuses: List[Dict[str, Any]],
+        current_time: float,
+        active_count: int,
+        paused_count: int,
+    ) -> str:
+        """Format the status report for the given trader statuses.
+        
+        Pure formatting (no I/O); _print_status runs it in a worker thread.
         
+        Args:
+            statuses: Trader statuses from Trader.get_status()
+            current_time: time.monotonic() of this status update
+            active_count: Number of active, non-paused traders
+            paused_count: Number of paused traders
+            
+        Returns:
+            Multi-line status report
+        """
         # Build status string for both console and log file
-        status_lines = []
-        status_lines.append("\n" + "=" * 80)
-        status_lines.append(f"Trader Manager Status - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        status_lines.append("=" * 80)
+        buf = io.StringIO()
+        emit = functools.partial(print, file=buf)  # Writes one line
+        emit(_STATUS_HEADER_RULE)
+        emit(f"Trader Manager Status - {time.strftime(STATUS_TIME_FORMAT)}")
+        emit(_SEP80)
         
         if self.start_time:
             uptime = current_time - self.start_time
-            # Count only non-paused traders
-            active_count = sum(1 for t in self.traders.values() if not t.is_paused and t.is_active)
-            paused_count = sum(1 for t in self.traders.values() if t.is_paused)
-            status_lines.append(f"Uptime: {uptime:.0f}s | Total Traders: {len(self.traders)} (Active: {active_count}, Paused: {paused_count})")
+            emit(f"Uptime: {uptime:.0f}s | Total Traders: {len(statuses)} (Active: {active_count}, Paused: {paused_count})")
         
         total_exposure_shares = 0.0
         total_exposure_dollars = 0.0
         total_pnl = 0.0
         total_trades = 0
         
-        for trader in self.traders.values():
-            status = await trader.get_status()
+        for status in statuses:
             total_exposure_shares += abs(status["position"])
             total_exposure_dollars += status.get("position_value", 0.0)
             total_pnl += status["total_pnl"]
@@ -289,8 +455,10 @@ class TraderManager:
                 spread_str = "N/A"
             
             # Format best bid/ask
-            best_bid_str = f"{status['best_bid']:.4f}" if status['best_bid'] is not None else "N/A"
-            best_ask_str = f"{status['best_ask']:.4f}" if status['best_ask'] is not None else "N/A"
+            best_bid = status['best_bid']
+            best_ask = status['best_ask']
+            best_bid_str = _fmt(best_bid, ".4f")
+            best_ask_str = _fmt(best_ask, ".4f")
             
             # Format order details
             order_details_str = "None"
@@ -305,7 +473,7 @@ class TraderManager:
                 order_details_str = ", ".join(order_parts)
             
             # Main trader line
-            status_lines.append(
+            emit(
                 f"  Trader: {status['name'][:25]:<25} | "
                 f"Market: {status['market_slug'][:30]:<30}"
             )
@@ -319,26 +487,26 @@ class TraderManager:
             position_value = status.get('position_value', 0.0)
             position_display = f"{position_shares:>8.2f} shares (${position_value:>7.2f})"
             
-            status_lines.append(
+            emit(
                 f"    Status: {'⏸️ PAUSED' if status['is_paused'] else '✅ ACTIVE'} | "
                 f"Position: {position_display} | "
                 f"P&L: ${status['total_pnl']:>7.2f} | "
                 f"Trades: {status['total_trades']:>4}"
             )
-            status_lines.append(
+            emit(
                 f"    Max Inventory: {max_inventory:>7.0f} shares | "
                 f"Current: {current_inventory:>7.2f} | Balance: {balance:>7.2f}"
             )
             # Show prices in both decimal and percentage format
-            best_bid_pct = f"({float(best_bid_str)*100:.2f}%)" if best_bid_str != "N/A" else ""
-            best_ask_pct = f"({float(best_ask_str)*100:.2f}%)" if best_ask_str != "N/A" else ""
+            best_bid_pct = "" if best_bid is None else f"({best_bid * 100:.2f}%)"
+            best_ask_pct = "" if best_ask is None else f"({best_ask * 100:.2f}%)"
             
-            status_lines.append(
+            emit(
                 f"    Best Bid: {best_bid_str:>10} {best_bid_pct:>8} | "
                 f"Best Ask: {best_ask_str:>10} {best_ask_pct:>8} | "
                 f"Spread: {spread_str:>6}"
             )
-            status_lines.append(
+            emit(
                 f"    Active Orders ({status['active_orders']}): {order_details_str}"
             )
             
@@ -349,11 +517,10 @@ class TraderManager:
                 min_order_value_sell = status.get('min_order_value_sell')
                 spread_threshold = status.get('spread_threshold', 0)
                 
-                decision_lines = []
-                decision_lines.append(f"    Market Requirements:")
-                decision_lines.append(f"      Spread threshold: {spread_threshold:.2f}¢ | Min order: {min_order_size:.0f} shares")
+                emit(f"    Market Requirements:")
+                emit(f"      Spread threshold: {spread_threshold:.2f}¢ | Min order: {min_order_size:.0f} shares")
                 if min_order_value_buy is not None:
-                    decision_lines.append(f"      BUY minimum: ${min_order_value_buy:.2f} | SELL minimum: ${min_order_value_sell:.2f}")
+                    emit(f"      BUY minimum: ${min_order_value_buy:.2f} | SELL minimum: ${min_order_value_sell:.2f}")
                 
                 # Determine why orders are/aren't placed
                 buy_reason = []
@@ -389,65 +556,125 @@ class TraderManager:
                     if not sell_reason:
                         sell_reason.append("⏳ Evaluating...")
                 
-                decision_lines.append(f"      BUY: {' | '.join(buy_reason)}")
-                decision_lines.append(f"      SELL: {' | '.join(sell_reason)}")
-                
-                for line in decision_lines:
-                    status_lines.append(line)
+                emit(f"      BUY: {' | '.join(buy_reason)}")
+                emit(f"      SELL: {' | '.join(sell_reason)}")
             
-            status_lines.append("")  # Empty line for readability
+            emit("")  # Empty line for readability
         
-        status_lines.append("-" * 80)
-        status_lines.append(
+        emit(_DASH80)
+        emit(
             f"Total Exposure: {total_exposure_shares:.2f} shares (${total_exposure_dollars:.2f}) | "
             f"Total P&L: ${total_pnl:.2f} | "
             f"Total Trades: {total_trades}"
         )
-        status_lines.append("=" * 80 + "\n")
+        emit(_SEP80)
         
-        # Print to console and log to file
-        status_text = "\n".join(status_lines)
-        print(status_text)
-        logger.info(f"\n{status_text}")
+        return buf.getvalue()
     
     async def run(self) -> None:
         """Main event loop for the manager."""
         self.is_running = True
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
         logger.info(f"Starting TraderManager with {len(self.traders)} traders")
         
+        # Prefer pushed trader changes; poll Supabase at the full rate only
+        # while Realtime is unavailable
+        if self.supabase_service and self.supabase_service.is_available():
+            self._realtime_sync = await self.supabase_service.subscribe_trader_changes(
+                self._on_trader_change, self._on_realtime_status
+            )
+        
+        # Each concern runs on its own cadence so a slow Supabase sync or
+        # status report never delays risk checks or trader steps
+        self._stop_event.clear()
+        loops = [
+            asyncio.create_task(self._risk_loop(), name="manager-risk"),
+            asyncio.create_task(self._step_loop(), name="manager-steps"),
+            asyncio.create_task(self._status_loop(), name="manager-status"),
+            # Sync traders from Supabase periodically to detect frontend changes
+            asyncio.create_task(self._sync_loop(), name="manager-sync"),
+        ]
+        stop_waiter = asyncio.create_task(self._stop_event.wait())
+        
         try:
-            while self.is_running:
-                # Check risk limits
-                if not await self._monitor_risk():
-                    logger.error("Risk limits exceeded. Shutting down.")
-                    break
-                
-                # Sync traders from Supabase periodically to detect frontend changes
-                current_time = time.time()
-                if current_time - self.last_supabase_sync >= self.config.supabase_sync_interval_seconds:
-                    await self._sync_traders_from_supabase()
-                    self.last_supabase_sync = current_time
-                
-                # Run all trader steps in parallel
-                tasks = [trader.step() for trader in self.traders.values() if trader.is_active]
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Print status periodically
-                await self._print_status()
-                
-                # Sleep before next iteration
-                await asyncio.sleep(self.config.poll_interval_seconds)
-                
+            # Run until stop() is called or any loop exits (risk breach or error)
+            done, _ = await asyncio.wait([*loops, stop_waiter], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not stop_waiter and not task.cancelled() and task.exception() is not None:
+                    error = task.exception()
+                    logger.error(f"Manager error in {task.get_name()}: {error}", exc_info=error)
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt. Shutting down...")
-        except Exception as e:
-            logger.error(f"Manager error: {e}", exc_info=True)
         finally:
+            for task in (*loops, stop_waiter):
+                task.cancel()
+            await asyncio.gather(*loops, stop_waiter, return_exceptions=True)
             await self.shutdown()
     
+    async def _risk_loop(self) -> None:
+        """Check risk limits every poll interval; returns once they are exceeded."""
+        while self.is_running:
+            if not await self._monitor_risk():
+                logger.error("Risk limits exceeded. Shutting down.")
+                return
+            await asyncio.sleep(max(MIN_POLL_INTERVAL_SECONDS, self.config.poll_interval_seconds))
+    
+    async def _step_loop(self) -> None:
+        """Run all trader steps in parallel, at most max_concurrent_steps at a time."""
+        while self.is_running:
+            if self._step_fns:
+                async with asyncio.TaskGroup() as task_group:
+                    for step in self._step_fns:
+                        task_group.create_task(self._guarded_step(step))
+            
+            # Sleep before next iteration
+            await asyncio.sleep(self._next_poll_delay())
+    
+    async def _status_loop(self) -> None:
+        """Print the status report every status_update_interval_seconds.
+        
+        Report errors are logged, never raised: a failed report must not stop trading.
+        """
+        interval = max(MIN_POLL_INTERVAL_SECONDS, self.config.status_update_interval_seconds)
+        while self.is_running:
+            try:
+                await self._print_status()
+            except Exception as e:
+                logger.error(f"Status report failed: {e}")
+            await asyncio.sleep(interval)
+    
+    async def _sync_loop(self) -> None:
+        """Poll Supabase for trader changes every supabase_sync_interval_seconds.
+        
+        While Realtime is subscribed the sync only reconciles missed events,
+        every REALTIME_RECONCILE_INTERVALS intervals; a Realtime failure
+        wakes it immediately.
+        """
+        while self.is_running:
+            self._sync_wakeup.clear()
+            await self._sync_traders_from_supabase()
+            self.last_supabase_sync = time.monotonic()
+            interval = self.config.supabase_sync_interval_seconds
+            if self._realtime_sync:
+                interval *= REALTIME_RECONCILE_INTERVALS
+            try:
+                await asyncio.wait_for(self._sync_wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _next_poll_delay(self) -> float:
+        """Seconds to sleep before the next run loop iteration.
+        
+        Uses poll_interval_seconds while any trader is running and the
+        (longer) idle_poll_interval_seconds otherwise, with jitter so the
+        loop doesn't tick in lockstep with other clients.
+        """
+        interval = self.config.poll_interval_seconds
+        if not self._running:
+            interval = max(interval, self.config.idle_poll_interval_seconds)
+        return max(MIN_POLL_INTERVAL_SECONDS, interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER))
+    
     async def shutdown(self) -> None:
         """Gracefully shutdown all traders."""
         logger.info("Shutting down TraderManager...")
@@ -459,27 +686,34 @@ class TraderManager:
         
         # Cancel all active orders
         logger.info("Cancelling all active orders...")
-        for trader in self.traders.values():
+        # Fetch current statuses concurrently to get active order IDs
+        statuses = await asyncio.gather(
+            *(trader.get_status() for trader in self.traders.values()), return_exceptions=True
+        )
+        order_ids = []
+        for status in statuses:
+            if isinstance(status, Exception):
+                logger.error(f"Failed to get trader status for shutdown: {status}")
+                continue
+            order_ids.extend(order['id'] for order in status.get('order_details', []) if order.get('id'))
+        
+        if order_ids:
             try:
-                # Fetch current status to get active order IDs
-                status = await trader.get_status()
-                order_details = status.get('order_details', [])
-                
-                for order in order_details:
-                    order_id = order.get('id')
-                    side = order.get('side')
-                    if order_id:
-                        try:
-                            await trader.execution.cancel(order_id)
-                            logger.info(f"Cancelled {side} order {order_id[:20]}...")
-                        except Exception as e:
-                            logger.error(f"Failed to cancel {side} order {order_id[:20]}...: {e}")
+                # One batch cancel request for every trader's orders
+                await self.execution.cancel_many(order_ids)
             except Exception as e:
-                logger.error(f"Failed to get trader status for shutdown: {e}")
+                logger.error(f"Batch cancel failed, cancelling orders individually: {e}")
+                results = await asyncio.gather(
+                    *(self.execution.cancel(order_id) for order_id in order_ids), return_exceptions=True
+                )
+                for order_id, result in zip(order_ids, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Failed to cancel order {order_id[:20]}...: {result}")
         
         logger.info("TraderManager shutdown complete")
     
     def stop(self) -> None:
         """Stop the manager (non-blocking)."""
         self.is_running = False
+        self._stop_event.set()
 
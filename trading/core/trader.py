@@ -2,19 +2,57 @@
 
 import logging
 import asyncio
-from dataclasses import dataclass
-from typing import Dict, Optional, Any, List
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional, Any, List, Tuple
 
-from services import PolymarketService, PolymarketServiceError
+from services import OrderBook, PolymarketService, PolymarketServiceError
 from config import TraderConfig
 
 logger = logging.getLogger(__name__)
 
 MIN_ORDER_SIZE = 5.0  # Polymarket minimum order size in shares
 PRICE_UPDATE_THRESHOLD = 0.0001  # Threshold for price comparisons (in decimal, not cents)
+SELL_REPLACE_SETTLE_SECONDS = 0.1  # Wait after cancelling a SELL so its shares are released
+TRACEBACK_LOG_INTERVAL_SECONDS = 60.0  # At most one step error traceback per exception type per interval
 
+# Exception type -> time.monotonic() before which its tracebacks are suppressed
+_traceback_next_allowed: Dict[type, float] = {}
 
-@dataclass
+# (best_bid, best_ask, best_bid_size, best_ask_size, second_best_bid, second_best_ask,
+# spread, spread_pct), prices in cents
+BookLevels = Tuple[
+    Optional[float], Optional[float], Optional[float], Optional[float],
+    Optional[float], Optional[float], Optional[float], Optional[float],
+]
+
+
+def _should_log_traceback(error: BaseException) -> bool:
+    """Allow one traceback per exception type per TRACEBACK_LOG_INTERVAL_SECONDS.
+    
+    Shared by all traders, so an outage failing every step logs one
+    traceback rather than one per trader per step.
+    """
+    now = time.monotonic()
+    error_type = type(error)
+    if now < _traceback_next_allowed.get(error_type, 0.0):
+        return False
+    _traceback_next_allowed[error_type] = now + TRACEBACK_LOG_INTERVAL_SECONDS
+    return True
+
+
+class _TraderLogAdapter(logging.LoggerAdapter):
+    """Prefixes messages with the trader's market id.
+    
+    process() only runs for records that pass the level check, so
+    %-style arguments are never formatted for filtered records.
+    """
+    
+    def process(self, msg, kwargs):
+        return self.extra["prefix"] + msg, kwargs
+
+
+@dataclass(slots=True)
 class MarketState:
     """Real-time market data from Polymarket - always fresh, never cached.
     
@@ -29,6 +67,8 @@ class MarketState:
     second_best_bid_cents: Optional[float] = None  # Second best bid in cents
     second_best_ask_cents: Optional[float] = None  # Second best ask in cents
     min_order_size: Optional[float] = None  # Market-specific minimum order size
+    spread_cents: Optional[float] = None  # best_ask - best_bid in cents
+    spread_pct: Optional[float] = None  # Spread as a percentage of best bid
     
     # From position API
     current_inventory: float = 0.0  # Current position in shares (from Polymarket)
@@ -45,6 +85,17 @@ class MarketState:
     my_ask_order_is_best_ask: bool = False  # Is it the current best ask?
 
 
+@dataclass(slots=True)
+class StepContext:
+    """Values derived once per step and shared by the sell and buy logic."""
+    market: MarketState
+    balance: float  # max_inventory - current_inventory, in shares
+    spread_cents: float  # best_ask - best_bid
+    min_order_size: float  # Market minimum, or MIN_ORDER_SIZE if unknown
+    price_improvement: float  # In cents, from config
+    cancel_ids: List[str] = field(default_factory=list)  # Orders to cancel (not replace), sent in one batch
+
+
 class Trader:
     """Market-making trader for a single market.
     
@@ -52,6 +103,26 @@ class Trader:
     All decisions are made based on real-time data from Polymarket API.
     """
     
+    __slots__ = (
+        "market_id",
+        "token_id",
+        "config",
+        "execution",
+        "supabase_service",
+        "is_active",
+        "is_paused",
+        "_trader_id",
+        "_book_levels",
+        "_step_lock",
+        "_order_actions",
+        "_idle_market",
+        "_best_level_tolerance",
+        "_status_static",
+        "log",
+        "total_trades",
+        "total_pnl",
+    )
+    
     def __init__(
         self,
         market_id: str,
@@ -59,32 +130,53 @@ class Trader:
         execution_layer: PolymarketService,
         supabase_service: Optional[Any] = None,  # SupabaseService, avoiding circular import
     ):
+        if not config.name:
+            config = replace(config, name=f"Trader-{market_id[:8]}")
+        
         self.market_id = market_id
+        self.log = _TraderLogAdapter(logger, {"prefix": f"Trader {market_id}: "})
         self.token_id = config.token_id or ""
         self.config = config
         self.execution = execution_layer
         self.supabase_service = supabase_service
         self.is_active = True
         self.is_paused = False
+        # An own order within this many cents of the best level counts as the
+        # best level; config is frozen, so derive it once
+        self._best_level_tolerance = config.price_improvement + 0.01
+        # get_status() fields that never change for this trader
+        self._status_static: Dict[str, Any] = {
+            "name": config.name,
+            "market_id": market_id,
+            "market_slug": config.market_slug or market_id[:20] + "...",
+            "max_inventory": config.max_inventory,
+            "spread_threshold": config.spread_threshold,
+            "price_improvement": config.price_improvement,
+        }
         self._trader_id: Optional[str] = None  # Cached trader UUID from DB
+        # Last orderbook snapshot seen and its extracted levels; the service
+        # returns the same OrderBook object until the book changes
+        self._book_levels: Optional[Tuple[OrderBook, BookLevels]] = None
+        self._step_lock = asyncio.Lock()  # One step at a time per market
+        # Order placements/replacements attempted, and the market state of the
+        # last step that attempted none: the same state again needs no action
+        self._order_actions = 0
+        self._idle_market: Optional[MarketState] = None
         
         # Statistics (for reporting only - not used for trading decisions)
         self.total_trades: int = 0
         self.total_pnl: float = 0.0
         
-        if not config.name:
-            config.name = f"Trader-{market_id[:8]}"
-        
         if not self.token_id:
-            logger.warning(
-                f"Trader '{config.name}' missing token_id - API calls will fail"
-            )
-        
-        logger.info(
-            f"Trader '{config.name}' initialized "
-            f"(token_id={'SET' if self.token_id else 'MISSING'}, "
-            f"max_inventory={config.max_inventory}, spread_threshold={config.spread_threshold}¢, "
-            f"price_improvement={config.price_improvement}¢)"
+            self.log.warning("'%s' missing token_id - API calls will fail", config.name)
+        
+        self.log.info(
+            "'%s' initialized (token_id=%s, max_inventory=%s, spread_threshold=%s¢, price_improvement=%s¢)",
+            config.name,
+            "SET" if self.token_id else "MISSING",
+            config.max_inventory,
+            config.spread_threshold,
+            config.price_improvement,
         )
     
     async def step(self) -> None:
@@ -95,29 +187,61 @@ class Trader:
         2. Calculate derived values (balance, spread)
         3. Execute SELL logic (always be best ask)
         4. Execute BUY logic (be best bid only if spread condition met)
+        5. Cancel orders neither side wants any more, in one batch
         """
         if not self.is_active or self.is_paused:
             return
+        if self._step_lock.locked():
+            # A previous step is still placing/cancelling orders; acting on a
+            # second snapshot now could duplicate them
+            self.log.debug("Previous step still running, skipping")
+            return
         
+        async with self._step_lock:
+            await self._step()
+    
+    async def _step(self) -> None:
+        """Body of step(), run under the step lock."""
         try:
             # Step 1: Fetch all real-time data from Polymarket
             market = await self._fetch_market_state()
             if not market.best_bid_cents or not market.best_ask_cents:
-                logger.debug(f"Trader {self.market_id}: Skipping step - missing bid/ask prices")
+                self.log.debug("Skipping step - missing bid/ask prices")
+                return
+            if market == self._idle_market:
+                # Same book, inventory and orders as a step that left everything
+                # as is: the decision would be identical
                 return
             
             # Step 2: Calculate derived values
-            balance = self.config.max_inventory - market.current_inventory
-            spread_cents = market.best_ask_cents - market.best_bid_cents
+            ctx = StepContext(
+                market=market,
+                balance=self.config.max_inventory - market.current_inventory,
+                spread_cents=market.spread_cents,
+                min_order_size=market.min_order_size or MIN_ORDER_SIZE,
+                price_improvement=self.config.price_improvement,
+            )
             
             # Step 3: Execute trading logic
-            await self._handle_sell_logic(market, balance)
-            await self._handle_buy_logic(market, balance, spread_cents)
+            order_actions = self._order_actions
+            self._idle_market = None
+            await self._handle_sell_logic(ctx)
+            await self._handle_buy_logic(ctx)
+            
+            # Step 4: Cancel orders that are no longer wanted, in one request
+            if ctx.cancel_ids:
+                try:
+                    await self.execution.cancel_many(ctx.cancel_ids)
+                except Exception as e:
+                    self.log.error("Failed to cancel %d orders: %s", len(ctx.cancel_ids), e)
+            elif self._order_actions == order_actions:
+                self._idle_market = market
             
         except PolymarketServiceError as e:
-            logger.error(f"Trader {self.market_id} Polymarket service error: {e}")
+            self.log.error("Polymarket service error: %s", e)
         except Exception as e:
-            logger.error(f"Trader {self.market_id} error: {e}", exc_info=True)
+            # Full traceback only for the first occurrence of this error type per interval
+            self.log.error("Step error: %s", e, exc_info=_should_log_traceback(e))
     
     async def _fetch_market_state(self) -> MarketState:
         """Fetch all real-time data from Polymarket.
@@ -127,30 +251,43 @@ class Trader:
         """
         state = MarketState()
         
-        # 1. Fetch orderbook
+        # Orderbook, position and open orders are independent reads: fetch them concurrently
+        orderbook, position, my_orders = await asyncio.gather(
+            self.execution.get_book(self.token_id),
+            self.execution.get_market_position(self.token_id),
+            self.execution.get_my_open_orders(self.token_id),
+            return_exceptions=True,
+        )
+        
+        # 1. Orderbook
         try:
-            orderbook = await self.execution.get_orderbook(self.token_id)
+            if isinstance(orderbook, BaseException):
+                raise orderbook
             if orderbook:
-                best_bid, best_ask, best_bid_size, best_ask_size, second_best_bid, second_best_ask = self._extract_best_prices(orderbook)
-                state.best_bid_cents = best_bid * 100 if best_bid else None  # Convert to cents
-                state.best_ask_cents = best_ask * 100 if best_ask else None  # Convert to cents
-                state.best_bid_size = best_bid_size
-                state.best_ask_size = best_ask_size
-                state.second_best_bid_cents = second_best_bid * 100 if second_best_bid else None  # Convert to cents
-                state.second_best_ask_cents = second_best_ask * 100 if second_best_ask else None  # Convert to cents
-                state.min_order_size = orderbook.get("min_order_size")
+                (
+                    state.best_bid_cents,
+                    state.best_ask_cents,
+                    state.best_bid_size,
+                    state.best_ask_size,
+                    state.second_best_bid_cents,
+                    state.second_best_ask_cents,
+                    state.spread_cents,
+                    state.spread_pct,
+                ) = self._get_book_levels(orderbook)
+                state.min_order_size = orderbook.min_order_size
         except Exception as e:
-            logger.warning(f"Trader {self.market_id} failed to fetch orderbook: {e}")
+            self.log.warning("Failed to fetch orderbook: %s", e)
         
-        # 2. Fetch current position
-        try:
-            state.current_inventory = await self.execution.get_market_position(self.token_id)
-        except Exception as e:
-            logger.warning(f"Trader {self.market_id} failed to fetch position: {e}")
+        # 2. Current position
+        if isinstance(position, BaseException):
+            self.log.warning("Failed to fetch position: %s", position)
+        else:
+            state.current_inventory = position
         
-        # 3. Fetch my open orders
+        # 3. My open orders
         try:
-            my_orders = await self.execution.get_my_open_orders(self.token_id)
+            if isinstance(my_orders, BaseException):
+                raise my_orders
             for order in my_orders:
                 side = order.get("side", "").upper()
                 order_id = order.get("id") or order.get("orderID") or order.get("order_id")
@@ -164,7 +301,7 @@ class Trader:
                     # Check if it's the best bid
                     if state.best_bid_cents and state.my_bid_order_price_cents:
                         price_diff = abs(state.my_bid_order_price_cents - state.best_bid_cents)
-                        state.my_bid_order_is_best_bid = price_diff < (self.config.price_improvement + 0.01)  # Within price_improvement
+                        state.my_bid_order_is_best_bid = price_diff < self._best_level_tolerance  # Within price_improvement
                 elif side == "SELL":
                     state.my_ask_order_id = order_id
                     state.my_ask_order_price_cents = price * 100 if price else None  # Convert to cents
@@ -172,13 +309,36 @@ class Trader:
                     # Check if it's the best ask
                     if state.best_ask_cents and state.my_ask_order_price_cents:
                         price_diff = abs(state.my_ask_order_price_cents - state.best_ask_cents)
-                        state.my_ask_order_is_best_ask = price_diff < (self.config.price_improvement + 0.01)  # Within price_improvement
+                        state.my_ask_order_is_best_ask = price_diff < self._best_level_tolerance  # Within price_improvement
         except Exception as e:
-            logger.warning(f"Trader {self.market_id} failed to fetch my orders: {e}")
+            self.log.warning("Failed to fetch my orders: %s", e)
         
         return state
     
-    def _extract_best_prices(self, orderbook: Dict) -> tuple[Optional[float], Optional[float], Optional[float], Optional[float], Optional[float], Optional[float]]:
+    def _get_book_levels(self, orderbook: OrderBook) -> BookLevels:
+        """Best/second-best levels of an orderbook in cents, extracted once per snapshot."""
+        cached = self._book_levels
+        if cached is not None and cached[0] is orderbook:
+            return cached[1]
+        
+        best_bid, best_ask, best_bid_size, best_ask_size, second_best_bid, second_best_ask = self._extract_best_prices(orderbook)
+        best_bid_cents = best_bid * 100 if best_bid else None  # Convert to cents
+        best_ask_cents = best_ask * 100 if best_ask else None
+        spread_cents = best_ask_cents - best_bid_cents if (best_ask_cents and best_bid_cents) else None
+        levels = (
+            best_bid_cents,
+            best_ask_cents,
+            best_bid_size,
+            best_ask_size,
+            second_best_bid * 100 if second_best_bid else None,
+            second_best_ask * 100 if second_best_ask else None,
+            spread_cents,
+            spread_cents / best_bid_cents * 100 if spread_cents else None,
+        )
+        self._book_levels = (orderbook, levels)
+        return levels
+    
+    def _extract_best_prices(self, orderbook: OrderBook) -> tuple[Optional[float], Optional[float], Optional[float], Optional[float], Optional[float], Optional[float]]:
         """Extract best bid/ask, second best bid/ask, and sizes from orderbook.
         
         Polymarket API returns:
@@ -187,28 +347,24 @@ class Trader:
         
         Returns: (best_bid, best_ask, best_bid_size, best_ask_size, second_best_bid, second_best_ask) in decimal
         """
-        try:
-            bids = orderbook.get("bids", [])
-            asks = orderbook.get("asks", [])
-            
-            # Best bid (last element = highest price)
-            best_bid = float(bids[-1]["price"]) if bids else None
-            best_bid_size = float(bids[-1].get("size", 0)) if bids else None
-            
-            # Second best bid (second-to-last element, if exists)
-            second_best_bid = float(bids[-2]["price"]) if len(bids) >= 2 else None
-            
-            # Best ask (last element = lowest price)
-            best_ask = float(asks[-1]["price"]) if asks else None
-            best_ask_size = float(asks[-1].get("size", 0)) if asks else None
-            
-            # Second best ask (second-to-last element, if exists)
-            second_best_ask = float(asks[-2]["price"]) if len(asks) >= 2 else None
-            
-            return best_bid, best_ask, best_bid_size, best_ask_size, second_best_bid, second_best_ask
-        except (KeyError, IndexError, ValueError) as e:
-            logger.warning(f"Trader {self.market_id} failed to parse orderbook: {e}")
-            return None, None, None, None, None, None
+        bid_px, bid_sz = orderbook.bid_px, orderbook.bid_sz
+        ask_px, ask_sz = orderbook.ask_px, orderbook.ask_sz
+        
+        # Best bid (last element = highest price)
+        best_bid = bid_px[-1] if bid_px else None
+        best_bid_size = bid_sz[-1] if bid_sz else None
+        
+        # Second best bid (second-to-last element, if exists)
+        second_best_bid = bid_px[-2] if len(bid_px) >= 2 else None
+        
+        # Best ask (last element = lowest price)
+        best_ask = ask_px[-1] if ask_px else None
+        best_ask_size = ask_sz[-1] if ask_sz else None
+        
+        # Second best ask (second-to-last element, if exists)
+        second_best_ask = ask_px[-2] if len(ask_px) >= 2 else None
+        
+        return best_bid, best_ask, best_bid_size, best_ask_size, second_best_bid, second_best_ask
     
     def _extract_price(self, order: Dict) -> Optional[float]:
         """Extract price from order dict."""
@@ -237,7 +393,7 @@ class Trader:
                 pass
         return None
     
-    async def _handle_sell_logic(self, market: MarketState, balance: float) -> None:
+    async def _handle_sell_logic(self, ctx: StepContext) -> None:
         """SELL logic: Always be the best ask.
         
         Strategy:
@@ -249,6 +405,8 @@ class Trader:
         - Have order AND it equals best_ask → add shares if inventory > order.size
         - Have order AND it's below best_ask → cancel + create new at (best_ask - price_improvement)
         """
+        market = ctx.market
+        price_improvement = ctx.price_improvement
         if not market.best_ask_cents:
             return
         
@@ -258,16 +416,13 @@ class Trader:
         if inventory <= 0:
             # No inventory to sell - cancel existing order if any
             if market.my_ask_order_id:
-                logger.info(f"Trader {self.market_id}: No inventory to sell, cancelling ask order")
-                try:
-                    await self.execution.cancel(market.my_ask_order_id)
-                except Exception as e:
-                    logger.error(f"Trader {self.market_id}: Failed to cancel ask order: {e}")
+                self.log.info("No inventory to sell, cancelling ask order")
+                ctx.cancel_ids.append(market.my_ask_order_id)
             return
         
-        min_order_size = market.min_order_size or MIN_ORDER_SIZE
+        min_order_size = ctx.min_order_size
         if inventory < min_order_size:
-            logger.debug(f"Trader {self.market_id}: Inventory {inventory:.2f} < min order size {min_order_size:.0f}")
+            self.log.debug("Inventory %.2f < min order size %.0f", inventory, min_order_size)
             return
         
         # Calculate target price
@@ -285,26 +440,25 @@ class Trader:
         # If we're sole best ask and second best exists and gap is > price_improvement, move closer
         if is_sole_best_ask and market.second_best_ask_cents is not None:
             gap_to_second_best = market.best_ask_cents - market.second_best_ask_cents
-            if gap_to_second_best > self.config.price_improvement:
+            if gap_to_second_best > price_improvement:
                 # Move to be price_improvement better than second best
-                target_price_cents = market.second_best_ask_cents - self.config.price_improvement
-                logger.info(
-                    f"Trader {self.market_id}: Sole best ask, moving closer to second best "
-                    f"(gap: {gap_to_second_best:.2f}¢ > {self.config.price_improvement:.2f}¢, "
-                    f"target: {target_price_cents:.2f}¢)"
+                target_price_cents = market.second_best_ask_cents - price_improvement
+                self.log.debug(
+                    "Sole best ask, moving closer to second best (gap: %.2f¢ > %.2f¢, target: %.2f¢)",
+                    gap_to_second_best, price_improvement, target_price_cents,
                 )
             else:
                 # Stay at best ask - price_improvement
-                target_price_cents = market.best_ask_cents - self.config.price_improvement
+                target_price_cents = market.best_ask_cents - price_improvement
         else:
             # Default: Be price_improvement better than best ask
-            target_price_cents = market.best_ask_cents - self.config.price_improvement
+            target_price_cents = market.best_ask_cents - price_improvement
         
         target_price_decimal = target_price_cents / 100.0  # Convert to decimal for API
         
         # Case 1: No open ask order
         if not market.my_ask_order_id:
-            logger.info(f"Trader {self.market_id}: No ask order, creating at {target_price_cents:.2f}¢ with {inventory:.2f} shares")
+            self.log.info("No ask order, creating at %.2f¢ with %.2f shares", target_price_cents, inventory)
             await self._place_order("SELL", target_price_decimal, inventory)
             return
         
@@ -314,35 +468,35 @@ class Trader:
             current_order_size = market.my_ask_order_size or 0.0
             if inventory > current_order_size:
                 additional_shares = inventory - current_order_size
-                logger.info(
-                    f"Trader {self.market_id}: Ask order is best ask, adding {additional_shares:.2f} shares "
-                    f"(current: {current_order_size:.2f}, inventory: {inventory:.2f})"
+                self.log.info(
+                    "Ask order is best ask, adding %.2f shares (current: %.2f, inventory: %.2f)",
+                    additional_shares, current_order_size, inventory,
                 )
                 # Cancel and replace with new size (Polymarket doesn't support in-place updates)
                 await self._replace_order(market.my_ask_order_id, "SELL", target_price_decimal, inventory, market)
             # Check if price needs to be updated (if we're sole best and should move closer)
             elif is_sole_best_ask and market.second_best_ask_cents is not None:
                 gap_to_second_best = market.best_ask_cents - market.second_best_ask_cents
-                if gap_to_second_best > self.config.price_improvement:
+                if gap_to_second_best > price_improvement:
                     # Price should be updated to move closer to second best
-                    new_target_price_cents = market.second_best_ask_cents - self.config.price_improvement
+                    new_target_price_cents = market.second_best_ask_cents - price_improvement
                     if abs(new_target_price_cents - market.my_ask_order_price_cents) > 0.01:  # Price changed
-                        logger.info(
-                            f"Trader {self.market_id}: Updating ask order price to move closer to second best "
-                            f"(from {market.my_ask_order_price_cents:.2f}¢ to {new_target_price_cents:.2f}¢)"
+                        self.log.info(
+                            "Updating ask order price to move closer to second best (from %.2f¢ to %.2f¢)",
+                            market.my_ask_order_price_cents, new_target_price_cents,
                         )
                         await self._replace_order(market.my_ask_order_id, "SELL", new_target_price_cents / 100.0, inventory, market)
             # If inventory <= current_order_size and price is correct, keep order as is
             return
         
         # Case 3: Have order AND it's below best_ask
-        logger.info(
-            f"Trader {self.market_id}: Ask order at {market.my_ask_order_price_cents:.2f}¢ is below best ask "
-            f"{market.best_ask_cents:.2f}¢, replacing"
+        self.log.info(
+            "Ask order at %.2f¢ is below best ask %.2f¢, replacing",
+            market.my_ask_order_price_cents, market.best_ask_cents,
         )
         await self._replace_order(market.my_ask_order_id, "SELL", target_price_decimal, inventory, market)
     
-    async def _handle_buy_logic(self, market: MarketState, balance: float, spread_cents: float) -> None:
+    async def _handle_buy_logic(self, ctx: StepContext) -> None:
         """BUY logic: Be best bid only if spread condition is met.
         
         Spread condition: (best_ask - best_bid - price_improvement) >= spread_threshold
@@ -354,42 +508,38 @@ class Trader:
           - Have order AND it's best bid → add shares if balance > order.size
           - Have order AND it's NOT best bid → cancel + create new at (best_bid + price_improvement)
         """
+        market = ctx.market
+        balance = ctx.balance
+        price_improvement = ctx.price_improvement
         if not market.best_bid_cents:
             return
         
         # Check spread condition
         # Condition: (best_ask - best_bid - price_improvement) >= spread_threshold
-        effective_spread = spread_cents - self.config.price_improvement
+        effective_spread = ctx.spread_cents - price_improvement
         spread_condition_met = effective_spread >= self.config.spread_threshold
         
         if not spread_condition_met:
             # Spread condition NOT met - cancel existing buy order if any
             if market.my_bid_order_id:
-                logger.info(
-                    f"Trader {self.market_id}: Spread condition not met "
-                    f"(effective_spread: {effective_spread:.2f}¢ < threshold: {self.config.spread_threshold:.2f}¢), "
-                    f"cancelling buy order"
+                self.log.info(
+                    "Spread condition not met (effective_spread: %.2f¢ < threshold: %.2f¢), cancelling buy order",
+                    effective_spread, self.config.spread_threshold,
                 )
-                try:
-                    await self.execution.cancel(market.my_bid_order_id)
-                except Exception as e:
-                    logger.error(f"Trader {self.market_id}: Failed to cancel buy order: {e}")
+                ctx.cancel_ids.append(market.my_bid_order_id)
             return
         
         # Spread condition met - proceed with buy logic
         if balance <= 0:
             # No balance to buy - cancel existing order if any
             if market.my_bid_order_id:
-                logger.info(f"Trader {self.market_id}: No balance to buy, cancelling bid order")
-                try:
-                    await self.execution.cancel(market.my_bid_order_id)
-                except Exception as e:
-                    logger.error(f"Trader {self.market_id}: Failed to cancel bid order: {e}")
+                self.log.info("No balance to buy, cancelling bid order")
+                ctx.cancel_ids.append(market.my_bid_order_id)
             return
         
-        min_order_size = market.min_order_size or MIN_ORDER_SIZE
+        min_order_size = ctx.min_order_size
         if balance < min_order_size:
-            logger.debug(f"Trader {self.market_id}: Balance {balance:.2f} < min order size {min_order_size:.0f}")
+            self.log.debug("Balance %.2f < min order size %.0f", balance, min_order_size)
             return
         
         # Calculate target price
@@ -407,28 +557,27 @@ class Trader:
         # If we're sole best bid and second best exists and gap is > price_improvement, move closer
         if is_sole_best_bid and market.second_best_bid_cents is not None:
             gap_to_second_best = market.best_bid_cents - market.second_best_bid_cents  # Best bid is higher than second best
-            if gap_to_second_best > self.config.price_improvement:
+            if gap_to_second_best > price_improvement:
                 # Move to be price_improvement better than second best
-                target_price_cents = market.second_best_bid_cents + self.config.price_improvement
-                logger.info(
-                    f"Trader {self.market_id}: Sole best bid, moving closer to second best "
-                    f"(gap: {gap_to_second_best:.2f}¢ > {self.config.price_improvement:.2f}¢, "
-                    f"target: {target_price_cents:.2f}¢)"
+                target_price_cents = market.second_best_bid_cents + price_improvement
+                self.log.debug(
+                    "Sole best bid, moving closer to second best (gap: %.2f¢ > %.2f¢, target: %.2f¢)",
+                    gap_to_second_best, price_improvement, target_price_cents,
                 )
             else:
                 # Stay at best bid + price_improvement
-                target_price_cents = market.best_bid_cents + self.config.price_improvement
+                target_price_cents = market.best_bid_cents + price_improvement
         else:
             # Default: Be price_improvement better than best bid
-            target_price_cents = market.best_bid_cents + self.config.price_improvement
+            target_price_cents = market.best_bid_cents + price_improvement
         
         target_price_decimal = target_price_cents / 100.0  # Convert to decimal for API
         
         # Case 1: No open bid order
         if not market.my_bid_order_id:
-            logger.info(
-                f"Trader {self.market_id}: No bid order, creating at {target_price_cents:.2f}¢ "
-                f"with {balance:.2f} shares (spread condition met: {effective_spread:.2f}¢ >= {self.config.spread_threshold:.2f}¢)"
+            self.log.info(
+                "No bid order, creating at %.2f¢ with %.2f shares (spread condition met: %.2f¢ >= %.2f¢)",
+                target_price_cents, balance, effective_spread, self.config.spread_threshold,
             )
             await self._place_order("BUY", target_price_decimal, balance)
             return
@@ -439,31 +588,31 @@ class Trader:
             current_order_size = market.my_bid_order_size or 0.0
             if balance > current_order_size:
                 additional_shares = balance - current_order_size
-                logger.info(
-                    f"Trader {self.market_id}: Bid order is best bid, adding {additional_shares:.2f} shares "
-                    f"(current: {current_order_size:.2f}, balance: {balance:.2f})"
+                self.log.info(
+                    "Bid order is best bid, adding %.2f shares (current: %.2f, balance: %.2f)",
+                    additional_shares, current_order_size, balance,
                 )
                 # Cancel and replace with new size
                 await self._replace_order(market.my_bid_order_id, "BUY", target_price_decimal, balance, market)
             # Check if price needs to be updated (if we're sole best and should move closer)
             elif is_sole_best_bid and market.second_best_bid_cents is not None:
                 gap_to_second_best = market.best_bid_cents - market.second_best_bid_cents  # Best bid is higher than second best
-                if gap_to_second_best > self.config.price_improvement:
+                if gap_to_second_best > price_improvement:
                     # Price should be updated to move closer to second best
-                    new_target_price_cents = market.second_best_bid_cents + self.config.price_improvement
+                    new_target_price_cents = market.second_best_bid_cents + price_improvement
                     if abs(new_target_price_cents - market.my_bid_order_price_cents) > 0.01:  # Price changed
-                        logger.info(
-                            f"Trader {self.market_id}: Updating bid order price to move closer to second best "
-                            f"(from {market.my_bid_order_price_cents:.2f}¢ to {new_target_price_cents:.2f}¢)"
+                        self.log.info(
+                            "Updating bid order price to move closer to second best (from %.2f¢ to %.2f¢)",
+                            market.my_bid_order_price_cents, new_target_price_cents,
                         )
                         await self._replace_order(market.my_bid_order_id, "BUY", new_target_price_cents / 100.0, balance, market)
             # If balance <= current_order_size and price is correct, keep order as is
             return
         
         # Case 3: Have order AND it's NOT best bid
-        logger.info(
-            f"Trader {self.market_id}: Bid order at {market.my_bid_order_price_cents:.2f}¢ is not best bid "
-            f"{market.best_bid_cents:.2f}¢, replacing"
+        self.log.info(
+            "Bid order at %.2f¢ is not best bid %.2f¢, replacing",
+            market.my_bid_order_price_cents, market.best_bid_cents,
         )
         await self._replace_order(market.my_bid_order_id, "BUY", target_price_decimal, balance, market)
     
@@ -475,16 +624,17 @@ class Trader:
             price: Price in decimal (e.g., 0.50 for 50 cents)
             size: Size in shares
         """
+        self._order_actions += 1
         try:
             order_id = await self.execution.submit_limit(
                 side=side, price=price, size=size, token_id=self.token_id
             )
-            logger.info(
-                f"Trader {self.market_id}: Placed {side} order {order_id[:20]}... "
-                f"({size:.2f} shares @ {price:.4f} = {price*100:.2f}¢)"
+            self.log.info(
+                "Placed %s order %.20s... (%.2f shares @ %.4f = %.2f¢)",
+                side, order_id, size, price, price * 100,
             )
         except Exception as e:
-            logger.error(f"Trader {self.market_id} failed to place {side} order: {e}")
+            self.log.error("Failed to place %s order: %s", side, e)
     
     async def _replace_order(self, old_order_id: str, side: str, new_price: float, new_size: float, market: MarketState) -> None:
         """Replace an order by cancelling old and placing new.
@@ -496,35 +646,41 @@ class Trader:
             new_size: New size in shares
             market: Current market state (for validation)
         """
+        self._order_actions += 1
         try:
-            # Cancel old order
-            await self.execution.cancel(old_order_id)
-            logger.info(f"Trader {self.market_id}: Cancelled {side} order {old_order_id[:20]}...")
-            
-            # Small delay to ensure cancellation is processed (especially for SELL orders)
-            if side == "SELL":
-                await asyncio.sleep(0.1)
-            
-            # Place new order
-            await self._place_order(side, new_price, new_size)
+            # Cancel old order and place the new one; the replacement is
+            # signed while the cancel is in flight. Small delay to ensure
+            # cancellation is processed (especially for SELL orders)
+            order_id = await self.execution.replace_order(
+                old_order_id,
+                side,
+                new_price,
+                new_size,
+                self.token_id,
+                settle_delay=SELL_REPLACE_SETTLE_SECONDS if side == "SELL" else 0.0,
+            )
+            self.log.info(
+                "Replaced %s order %.20s... with %.20s... (%.2f shares @ %.4f = %.2f¢)",
+                side, old_order_id, order_id, new_size, new_price, new_price * 100,
+            )
             
         except Exception as e:
-            logger.error(f"Trader {self.market_id} failed to replace {side} order {old_order_id[:20]}...: {e}")
+            self.log.error("Failed to replace %s order %.20s...: %s", side, old_order_id, e)
     
     def pause(self) -> None:
         """Pause the trader."""
         self.is_paused = True
-        logger.info(f"Trader {self.market_id} paused")
+        self.log.info("Paused")
     
     def resume(self) -> None:
         """Resume the trader."""
         self.is_paused = False
-        logger.info(f"Trader {self.market_id} resumed")
+        self.log.info("Resumed")
     
     def stop(self) -> None:
         """Stop the trader."""
         self.is_active = False
-        logger.info(f"Trader {self.market_id} stopped")
+        self.log.info("Stopped")
     
     async def get_status(self) -> Dict:
         """Get current trader status for monitoring.
@@ -537,8 +693,7 @@ class Trader:
             
             # Calculate derived values
             balance = self.config.max_inventory - market.current_inventory
-            spread_cents = market.best_ask_cents - market.best_bid_cents if (market.best_ask_cents and market.best_bid_cents) else None
-            spread_decimal = spread_cents / 100.0 if spread_cents else None
+            spread_cents = market.spread_cents
             
             # Count active orders
             active_orders = 0
@@ -564,35 +719,28 @@ class Trader:
             position_value = abs(market.current_inventory * (market.best_bid_cents / 100.0 if market.best_bid_cents else 0.0))
             
             return {
-                "name": self.config.name,
-                "market_id": self.market_id,
-                "market_slug": self.config.market_slug or self.market_id[:20] + "...",
+                **self._status_static,
                 "position": market.current_inventory,
                 "position_value": position_value,
                 "active_orders": active_orders,
                 "order_details": order_details,
                 "best_bid": market.best_bid_cents / 100.0 if market.best_bid_cents else None,
                 "best_ask": market.best_ask_cents / 100.0 if market.best_ask_cents else None,
-                "spread": spread_decimal,
+                "spread": spread_cents / 100.0 if spread_cents else None,
                 "spread_cents": spread_cents,
-                "spread_pct": (spread_cents / market.best_bid_cents * 100) if (spread_cents and market.best_bid_cents) else None,
+                "spread_pct": market.spread_pct,
                 "total_pnl": self.total_pnl,
                 "total_trades": self.total_trades,
                 "is_paused": self.is_paused,
                 "is_active": self.is_active,
-                "max_inventory": self.config.max_inventory,
                 "balance": balance,
-                "spread_threshold": self.config.spread_threshold,
                 "min_order_size": market.min_order_size,
-                "price_improvement": self.config.price_improvement,
             }
         except Exception as e:
-            logger.warning(f"Trader {self.market_id} failed to get status: {e}")
+            self.log.warning("Failed to get status: %s", e)
             # Return basic info on error
             return {
-                "name": self.config.name,
-                "market_id": self.market_id,
-                "market_slug": self.config.market_slug or self.market_id[:20] + "...",
+                **self._status_static,
                 "is_paused": self.is_paused,
                 "is_active": self.is_active,
                 "error": str(e),
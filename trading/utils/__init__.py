@@ -1,8 +1,10 @@
 """Trading utilities."""
 
 from .slug_resolver import market_slug_resolver
+from .retry import retry_db_operation
 
 __all__ = [
     "market_slug_resolver",
+    "retry_db_operation",
 ]
 
@@ -0,0 +1,62 @@
+"""Retry helper for database operations.
+
+Retries transient failures (dropped pooler connections, pool timeouts)
+with jittered exponential backoff.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+async def retry_db_operation(
+    operation: Callable[[], Awaitable[Any]],
+    retry_on: Tuple[Type[BaseException], ...],
+    on_retry: Optional[Callable[[BaseException], Awaitable[None]]] = None,
+    max_retries: int = 6,
+    base_delay: float = 0.1,
+    max_delay: float = 10.0,
+    jitter: bool = True,
+) -> Any:
+    """Run an operation, retrying transient errors with exponential backoff.
+
+    The delay before retry n is base_delay * 2**n capped at max_delay; with
+    jitter it is drawn uniformly from [0, delay] so concurrent callers don't
+    retry in lockstep. Errors not in retry_on are raised immediately.
+
+    Args:
+        operation: Zero-argument callable returning a fresh awaitable per attempt
+        retry_on: Exception types treated as transient
+        on_retry: Optional coroutine called with the error before each retry
+            (e.g. to reset the connection)
+        max_retries: Maximum number of retries after the first attempt
+        base_delay: Delay before the first retry, in seconds
+        max_delay: Upper bound for any single delay, in seconds
+        jitter: Randomize each delay (full jitter)
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        The last error once max_retries is exhausted, or any non-transient error
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await operation()
+        except retry_on as e:
+            if attempt >= max_retries:
+                logger.error(f"Database operation failed after {max_retries + 1} attempts: {e}")
+                raise
+            delay = min(max_delay, base_delay * (2 ** attempt))
+            if jitter:
+                delay = random.uniform(0, delay)
+            logger.warning(
+                f"Database operation failed (attempt {attempt + 1}/{max_retries + 1}): {e!r}. "
+                f"Retrying in {delay:.2f}s..."
+            )
+            if on_retry is not None:
+                await on_retry(e)
+            await asyncio.sleep(delay)